@@ -0,0 +1,38 @@
+"""
+In-memory response caching
+
+Short-lived, per-process caches for expensive queries whose results change
+rarely (tag lists, dashboard aggregates). Writes clear them so the next read
+reflects the new data; the TTL bounds staleness across worker processes.
+"""
+import threading
+
+from cachetools import TTLCache
+
+# Unique tag list, keyed by endpoint name
+tag_cache = TTLCache(maxsize=16, ttl=60)
+
+# Dashboard aggregates, keyed by (endpoint name, days)
+stats_cache = TTLCache(maxsize=128, ttl=30)
+
+# Handlers run in FastAPI's threadpool and TTLCache is not thread-safe
+_lock = threading.Lock()
+
+
+def get_cached(cache: TTLCache, key):
+    """Return the cached value for key, or None if missing or expired"""
+    with _lock:
+        return cache.get(key)
+
+
+def set_cached(cache: TTLCache, key, value):
+    """Store value under key"""
+    with _lock:
+        cache[key] = value
+
+
+def invalidate_caches():
+    """Drop all cached responses after decisions are created or deleted"""
+    with _lock:
+        tag_cache.clear()
+        stats_cache.clear()
@@ -1,11 +1,16 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+import orjson
 import os
 
+from app.serialization import dumps
+
 # Use SQLite for development, PostgreSQL for production
 DATABASE_URL = os.getenv(
     "DATABASE_URL",
@@ -16,12 +21,46 @@ DATABASE_URL = os.getenv(
 if DATABASE_URL.startswith("postgres://"):
     DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
 
-# Create engine
+IS_SQLITE = DATABASE_URL.startswith("sqlite")
+
+# In-memory SQLite uses a SingletonThreadPool, which takes no sizing arguments
+_url = make_url(DATABASE_URL)
+POOL_KWARGS = (
+    {"pool_size": 20, "max_overflow": 10, "pool_timeout": 30}
+    if issubclass(_url.get_dialect().get_pool_class(_url), QueuePool)
+    else {}
+)
+
+
+def json_serializer(value):
+    """Encode JSON columns with orjson (stdlib fallback); drivers expect str"""
+    return dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Create engine with an explicit, health-checked connection pool
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+    pool_recycle=3600,
+    pool_pre_ping=True,
+    json_serializer=json_serializer,
+    **POOL_KWARGS
 )
 
+
+if IS_SQLITE:
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each new SQLite connection for concurrent reads and a warm page cache"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.close()
+
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -3,20 +3,39 @@ AI Decision Timeline - Main FastAPI Application
 
 This is the entry point for the backend API that powers the decision timeline system.
 """
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from app.database import engine, Base
+from sqlalchemy import text
+from app.database import engine, IS_SQLITE
 from app.routers import decisions, traces, stats
+from app.serialization import JSONResponse
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Worker startup hook
+    
+    The schema is managed by Alembic (`alembic upgrade head`), so startup only
+    refreshes SQLite's query planner statistics where they are stale.
+    """
+    if IS_SQLITE:
+        with engine.connect() as conn:
+            conn.execute(text("PRAGMA optimize"))
+    yield
 
-# Create database tables
-Base.metadata.create_all(bind=engine)
 
 app = FastAPI(
     title="AI Decision Timeline API",
     description="Visual-first system for AI decision traceability and explainability",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=JSONResponse,
+    lifespan=lifespan
 )
 
 # CORS middleware for frontend access
@@ -28,6 +47,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    """Render 422s with the app's encoder, so echoed NaN input cannot break them"""
+    return JSONResponse(status_code=422, content={"detail": jsonable_encoder(exc.errors())})
+
+
 # Include routers
 app.include_router(decisions.router, prefix="/api", tags=["decisions"])
 app.include_router(traces.router, prefix="/api", tags=["traces"])
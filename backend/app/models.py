@@ -6,7 +6,7 @@ Each decision is composed of:
 - Decision data (input, state, reasoning, decision, outcome)
 - Steps (ordered sequence of decision stages)
 """
-from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, JSON, Text, Enum
+from sqlalchemy import Column, String, Integer, Float, DateTime, ForeignKey, JSON, Text, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -59,6 +59,14 @@ class Decision(Base):
     
     # Relationships
     steps = relationship("DecisionStep", back_populates="decision", cascade="all, delete-orphan", order_by="DecisionStep.step_order")
+    tag_links = relationship("DecisionTag", cascade="all, delete-orphan")
+    
+    # Indexes for the hot filter/sort paths (timeline listing, stats ranges)
+    __table_args__ = (
+        Index("ix_decisions_ts", timestamp.desc()),
+        Index("ix_decisions_source_ts", "source", "timestamp"),
+        Index("ix_decisions_conf_ts", "confidence", "timestamp"),
+    )
     
     def __repr__(self):
         return f"<Decision {self.decision_id} - {self.decision} ({self.confidence:.2f})>"
@@ -73,7 +81,7 @@ class DecisionStep(Base):
     __tablename__ = "decision_steps"
     
     id = Column(Integer, primary_key=True, index=True)
-    decision_id = Column(Integer, ForeignKey("decisions.id"), nullable=False)
+    decision_id = Column(Integer, ForeignKey("decisions.id"), nullable=False, index=True)
     
     step_order = Column(Integer, nullable=False)  # 0, 1, 2, 3...
     step_type = Column(Enum(StepType), nullable=False)
@@ -88,3 +96,23 @@ class DecisionStep(Base):
     
     def __repr__(self):
         return f"<Step {self.step_order}: {self.step_type} - {self.content[:50]}>"
+
+
+class DecisionTag(Base):
+    """
+    Tag assigned to a decision
+    
+    Normalized copy of Decision.tags so tag filters and the unique tag list
+    are index lookups instead of JSON scans.
+    """
+    __tablename__ = "decision_tags"
+    
+    decision_id = Column(Integer, ForeignKey("decisions.id"), primary_key=True)
+    tag = Column(String, primary_key=True)
+    
+    __table_args__ = (
+        Index("ix_decision_tags_tag", "tag", "decision_id"),
+    )
+    
+    def __repr__(self):
+        return f"<DecisionTag {self.decision_id}: {self.tag}>"
@@ -3,38 +3,46 @@ Decision endpoints
 
 Handles creating, retrieving, and querying decision records.
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Body, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy.orm import Session, load_only, selectinload
+from sqlalchemy import func, insert, select
 from typing import List, Optional
 from datetime import datetime
 import uuid
 import csv
 import io
-import json
+import msgspec
+import orjson
 
+from app.cache import invalidate_caches
 from app.database import get_db
-from app.models import Decision as DecisionModel, DecisionStep as StepModel
-from app.schemas import Decision, DecisionCreate, DecisionSummary, DecisionReplay, DecisionSource
+from app.models import Decision as DecisionModel, DecisionStep as StepModel, DecisionTag as TagModel
+from app.search import search_filter
+from app.serialization import dumps
+from app.schemas import (
+    Decision, DecisionCreate, DecisionPage, DecisionPageStruct, DecisionReplay,
+    DecisionSource, DecisionSummaryStruct
+)
 from app.services.trace_builder import TraceBuilder
 
 router = APIRouter()
 
+# Stateless, so a single instance is shared across requests
+trace_builder = TraceBuilder()
 
-@router.post("/decisions", response_model=Decision, status_code=201)
-async def create_decision(
-    decision: DecisionCreate,
-    db: Session = Depends(get_db)
-):
-    """
-    Create a new decision record
-    
-    Accepts decision data and optional steps. If steps are not provided,
-    they will be auto-generated based on the decision data.
-    """
+# Target size of each streamed export chunk, in characters
+_EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+def _insert_decision(db: Session, decision: DecisionCreate) -> Decision:
+    """Insert a decision with its steps and tags, without committing"""
     # Generate unique decision ID
     decision_id = f"dec_{uuid.uuid4().hex[:12]}"
     
+    # Range is enforced by the schema; round once here for storage
+    decision.confidence = round(decision.confidence, 4)
+    
     # Create decision record
     db_decision = DecisionModel(
         decision_id=decision_id,
@@ -52,40 +60,83 @@ async def create_decision(
     db.add(db_decision)
     db.flush()  # Get the ID without committing
     
-    # Create steps
+    # Use provided steps, or auto-generate them from decision data
     if decision.steps:
-        # Use provided steps
-        for idx, step in enumerate(decision.steps):
-            db_step = StepModel(
-                decision_id=db_decision.id,
-                step_order=idx,
-                step_type=step.step_type,
-                content=step.content,
-                step_metadata=step.step_metadata
-            )
-            db.add(db_step)
+        steps = decision.steps
     else:
-        # Auto-generate steps from decision data
-        trace_builder = TraceBuilder()
         steps = trace_builder.build_steps(decision)
-        for idx, step in enumerate(steps):
-            db_step = StepModel(
-                decision_id=db_decision.id,
-                step_order=idx,
-                step_type=step.step_type,
-                content=step.content,
-                step_metadata=step.step_metadata
-            )
-            db.add(db_step)
+    
+    # Insert all steps in a single batched statement, returning the new rows
+    # in step order (executemany RETURNING is otherwise unordered)
+    created_steps = db.scalars(insert(StepModel).returning(StepModel, sort_by_parameter_order=True), [
+        {
+            "decision_id": db_decision.id,
+            "step_order": idx,
+            "step_type": step.step_type,
+            "content": step.content,
+            "step_metadata": step.step_metadata
+        }
+        for idx, step in enumerate(steps)
+    ]).all()
+    
+    # Index tags for filtering
+    if decision.tags:
+        db.execute(insert(TagModel), [
+            {"decision_id": db_decision.id, "tag": tag}
+            for tag in dict.fromkeys(decision.tags)
+        ])
+    
+    # Build the response from in-memory state so no re-SELECT is needed
+    response = Decision(
+        id=db_decision.id,
+        decision_id=decision_id,
+        timestamp=db_decision.timestamp,
+        steps=created_steps,
+        **decision.model_dump(exclude={"steps"})
+    )
+    
+    return response
+
+
+@router.post("/decisions", response_model=Decision, status_code=201)
+def create_decision(
+    decision: DecisionCreate,
+    db: Session = Depends(get_db)
+):
+    """
+    Create a new decision record
+    
+    Accepts decision data and optional steps. If steps are not provided,
+    they will be auto-generated based on the decision data.
+    """
+    response = _insert_decision(db, decision)
     
     db.commit()
-    db.refresh(db_decision)
+    invalidate_caches()
     
-    return db_decision
+    return response
 
 
-@router.get("/decisions", response_model=dict)
-async def get_decisions(
+@router.post("/decisions/batch", response_model=List[Decision], status_code=201)
+def create_decisions_batch(
+    decisions: List[DecisionCreate] = Body(..., max_length=500),
+    db: Session = Depends(get_db)
+):
+    """
+    Create several decision records in one transaction
+    
+    Returns the created decisions in request order.
+    """
+    responses = [_insert_decision(db, decision) for decision in decisions]
+    
+    db.commit()
+    invalidate_caches()
+    
+    return responses
+
+
+@router.get("/decisions", response_model=DecisionPage)
+def get_decisions(
     limit: int = Query(default=50, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     source: Optional[DecisionSource] = None,
@@ -102,7 +153,17 @@ async def get_decisions(
     Returns lightweight summaries for efficient timeline rendering.
     Now includes total count for proper pagination UI.
     """
-    query = db.query(DecisionModel)
+    # Only fetch the columns a summary needs; skip the large JSON/Text payloads
+    query = db.query(DecisionModel).options(load_only(
+        DecisionModel.id,
+        DecisionModel.decision_id,
+        DecisionModel.timestamp,
+        DecisionModel.decision,
+        DecisionModel.confidence,
+        DecisionModel.source,
+        DecisionModel.outcome,
+        DecisionModel.tags
+    ))
     
     # Apply filters
     if source:
@@ -115,19 +176,13 @@ async def get_decisions(
         query = query.filter(DecisionModel.confidence <= max_confidence)
     
     if tag:
-        query = query.filter(DecisionModel.tags.contains([tag]))
+        query = query.filter(DecisionModel.id.in_(
+            select(TagModel.decision_id).where(TagModel.tag == tag)
+        ))
     
     # Search functionality (reasoning, decision, outcome)
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            (DecisionModel.reasoning.ilike(search_term)) |
-            (DecisionModel.decision.ilike(search_term)) |
-            (DecisionModel.outcome.ilike(search_term))
-        )
-    
-    # Get total count before pagination
-    total = query.count()
+        query = query.filter(search_filter(db, search))
     
     # Sort
     if sort == "desc":
@@ -135,42 +190,56 @@ async def get_decisions(
     else:
         query = query.order_by(DecisionModel.timestamp.asc())
     
-    # Paginate
-    decisions = query.offset(offset).limit(limit).all()
-    
-    # Convert to summaries
-    summaries = []
-    for decision in decisions:
-        summaries.append(DecisionSummary(
-            id=decision.id,
-            decision_id=decision.decision_id,
-            timestamp=decision.timestamp,
-            decision=decision.decision,
-            confidence=decision.confidence,
-            source=decision.source,
-            outcome=decision.outcome,
-            tags=decision.tags,
-            step_count=len(decision.steps)
-        ))
+    # Paginate, counting steps and the total matches in the same round trip
+    rows = query.add_columns(
+        func.count(StepModel.id),
+        func.count().over()
+    ).outerjoin(StepModel).group_by(DecisionModel.id).offset(offset).limit(limit).all()
+    
+    if rows:
+        total = rows[0][2]
+    elif offset:
+        # Past the last page the window is empty; count the matches directly
+        total = query.order_by(None).count()
+    else:
+        total = 0
+    
+    # Encode with msgspec, bypassing FastAPI's response validation/encoding
+    page = DecisionPageStruct(
+        decisions=[
+            DecisionSummaryStruct(
+                id=decision.id,
+                decision_id=decision.decision_id,
+                timestamp=decision.timestamp,
+                decision=decision.decision,
+                confidence=decision.confidence,
+                source=decision.source,
+                outcome=decision.outcome,
+                tags=decision.tags,
+                step_count=step_count
+            )
+            for decision, step_count, _ in rows
+        ],
+        total=total,
+        limit=limit,
+        offset=offset,
+        has_more=offset + limit < total
+    )
     
-    return {
-        "decisions": summaries,
-        "total": total,
-        "limit": limit,
-        "offset": offset,
-        "has_more": offset + limit < total
-    }
+    return Response(msgspec.json.encode(page), media_type="application/json")
 
 
 @router.get("/decisions/{decision_id}", response_model=Decision)
-async def get_decision(
+def get_decision(
     decision_id: str,
     db: Session = Depends(get_db)
 ):
     """
     Get full details of a specific decision
     """
-    decision = db.query(DecisionModel).filter(
+    decision = db.query(DecisionModel).options(
+        selectinload(DecisionModel.steps)
+    ).filter(
         DecisionModel.decision_id == decision_id
     ).first()
     
@@ -181,7 +250,7 @@ async def get_decision(
 
 
 @router.get("/decisions/{decision_id}/replay", response_model=DecisionReplay)
-async def replay_decision(
+def replay_decision(
     decision_id: str,
     db: Session = Depends(get_db)
 ):
@@ -190,29 +259,37 @@ async def replay_decision(
     
     This endpoint structures the data for step-by-step playback.
     """
-    decision = db.query(DecisionModel).filter(
+    decision = db.query(DecisionModel).options(
+        selectinload(DecisionModel.steps)
+    ).filter(
         DecisionModel.decision_id == decision_id
     ).first()
     
     if not decision:
         raise HTTPException(status_code=404, detail="Decision not found")
     
-    # Calculate duration
+    # Calculate duration and step count with a single aggregate
+    first_ts, last_ts, step_count = db.query(
+        func.min(StepModel.timestamp),
+        func.max(StepModel.timestamp),
+        func.count(StepModel.id)
+    ).filter(
+        StepModel.decision_id == decision.id
+    ).one()
+    
     duration = None
-    if decision.steps:
-        first_step = min(decision.steps, key=lambda s: s.timestamp)
-        last_step = max(decision.steps, key=lambda s: s.timestamp)
-        duration = (last_step.timestamp - first_step.timestamp).total_seconds()
+    if step_count:
+        duration = (last_ts - first_ts).total_seconds()
     
     return DecisionReplay(
         decision=decision,
-        total_steps=len(decision.steps),
+        total_steps=step_count,
         duration_seconds=duration
     )
 
 
 @router.delete("/decisions/{decision_id}", status_code=204)
-async def delete_decision(
+def delete_decision(
     decision_id: str,
     db: Session = Depends(get_db)
 ):
@@ -228,18 +305,22 @@ async def delete_decision(
     
     db.delete(decision)
     db.commit()
+    invalidate_caches()
     
     return None
 
 
 @router.get("/decisions/export/csv")
-async def export_decisions_csv(
+def export_decisions_csv(
     source: Optional[DecisionSource] = None,
     min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0),
     db: Session = Depends(get_db)
 ):
     """
     Export decisions to CSV format
+    
+    Rows are streamed from a batched query, so memory use stays constant
+    regardless of how many decisions are exported.
     """
     query = db.query(DecisionModel)
     
@@ -248,48 +329,58 @@ async def export_decisions_csv(
     if min_confidence is not None:
         query = query.filter(DecisionModel.confidence >= min_confidence)
     
-    decisions = query.order_by(DecisionModel.timestamp.desc()).all()
-    
-    # Create CSV in memory
-    output = io.StringIO()
-    writer = csv.writer(output)
+    query = query.order_by(DecisionModel.timestamp.desc())
     
-    # Write header
-    writer.writerow([
-        'Decision ID', 'Timestamp', 'Decision', 'Confidence', 
-        'Source', 'Reasoning', 'Outcome', 'Tags'
-    ])
-    
-    # Write data
-    for decision in decisions:
+    def generate():
+        # Rows are flushed in ~64 KB chunks: each yield costs a threadpool hop
+        # and an ASGI send, so per-row chunks would dominate the export time
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        # Write header
         writer.writerow([
-            decision.decision_id,
-            decision.timestamp.isoformat(),
-            decision.decision,
-            decision.confidence,
-            decision.source,
-            decision.reasoning or '',
-            decision.outcome or '',
-            ','.join(decision.tags) if decision.tags else ''
+            'Decision ID', 'Timestamp', 'Decision', 'Confidence', 
+            'Source', 'Reasoning', 'Outcome', 'Tags'
         ])
-    
-    output.seek(0)
+        
+        # Write data
+        for decision in query.yield_per(1000):
+            writer.writerow([
+                decision.decision_id,
+                decision.timestamp.isoformat(),
+                decision.decision,
+                decision.confidence,
+                decision.source,
+                decision.reasoning or '',
+                decision.outcome or '',
+                ','.join(decision.tags) if decision.tags else ''
+            ])
+            if buffer.tell() >= _EXPORT_CHUNK_SIZE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+        
+        yield buffer.getvalue()
     
     return StreamingResponse(
-        iter([output.getvalue()]),
+        generate(),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename=decisions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"}
     )
 
 
 @router.get("/decisions/export/json")
-async def export_decisions_json(
+def export_decisions_json(
     source: Optional[DecisionSource] = None,
     min_confidence: Optional[float] = Query(None, ge=0.0, le=1.0),
+    pretty: bool = False,
     db: Session = Depends(get_db)
 ):
     """
-    Export decisions to JSON format
+    Export decisions as newline-delimited JSON
+    
+    The first line holds export metadata, followed by one decision per line.
+    Pass pretty=true for a single indented JSON document instead.
     """
     query = db.query(DecisionModel)
     
@@ -298,40 +389,57 @@ async def export_decisions_json(
     if min_confidence is not None:
         query = query.filter(DecisionModel.confidence >= min_confidence)
     
-    decisions = query.order_by(DecisionModel.timestamp.desc()).all()
+    total = query.count()
+    query = query.options(
+        selectinload(DecisionModel.steps)
+    ).order_by(DecisionModel.timestamp.desc())
     
-    # Convert to dict
-    export_data = {
+    meta = {
         "export_date": datetime.now().isoformat(),
-        "total_decisions": len(decisions),
-        "decisions": [
-            {
-                "decision_id": d.decision_id,
-                "timestamp": d.timestamp.isoformat(),
-                "input_data": d.input_data,
-                "system_state": d.system_state,
-                "reasoning": d.reasoning,
-                "decision": d.decision,
-                "confidence": d.confidence,
-                "source": d.source,
-                "outcome": d.outcome,
-                "outcome_data": d.outcome_data,
-                "tags": d.tags,
-                "steps": [
-                    {
-                        "step_order": s.step_order,
-                        "step_type": s.step_type,
-                        "content": s.content,
-                        "timestamp": s.timestamp.isoformat(),
-                        "metadata": s.step_metadata
-                    } for s in sorted(d.steps, key=lambda x: x.step_order)
-                ]
-            } for d in decisions
-        ]
+        "total_decisions": total
     }
     
+    def serialize(d):
+        return {
+            "decision_id": d.decision_id,
+            "timestamp": d.timestamp.isoformat(),
+            "input_data": d.input_data,
+            "system_state": d.system_state,
+            "reasoning": d.reasoning,
+            "decision": d.decision,
+            "confidence": d.confidence,
+            "source": d.source,
+            "outcome": d.outcome,
+            "outcome_data": d.outcome_data,
+            "tags": d.tags,
+            "steps": [
+                {
+                    "step_order": s.step_order,
+                    "step_type": s.step_type,
+                    "content": s.content,
+                    "timestamp": s.timestamp.isoformat(),
+                    "metadata": s.step_metadata
+                } for s in d.steps  # already ordered by step_order
+            ]
+        }
+    
+    def generate_ndjson():
+        yield dumps({"meta": meta}) + b"\n"
+        for d in query.yield_per(500):
+            yield dumps(serialize(d)) + b"\n"
+    
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    if pretty:
+        # Legacy single-document format; built in memory
+        export_data = {**meta, "decisions": [serialize(d) for d in query.yield_per(500)]}
+        return StreamingResponse(
+            iter([dumps(export_data, option=orjson.OPT_INDENT_2)]),
+            media_type="application/json",
+            headers={"Content-Disposition": f"attachment; filename=decisions_{timestamp}.json"}
+        )
+    
     return StreamingResponse(
-        iter([json.dumps(export_data, indent=2)]),
-        media_type="application/json",
-        headers={"Content-Disposition": f"attachment; filename=decisions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"}
+        generate_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f"attachment; filename=decisions_{timestamp}.ndjson"}
     )
@@ -5,19 +5,65 @@ Provides aggregated analytics and insights about decisions.
 """
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import func, case, text
 from typing import Optional
 from datetime import datetime, timedelta
 
+from app.cache import stats_cache, get_cached, set_cached
 from app.database import get_db
 from app.models import Decision as DecisionModel
 from app.schemas import DecisionSource
 
 router = APIRouter()
 
+# Zero-filled per-day aggregates over [:start, :end], one statement per supported dialect
+_DAILY_SERIES_SQL = {
+    "postgresql": text("""
+        SELECT CAST(days.day AS date), count(decisions.id), avg(decisions.confidence)
+        FROM generate_series(
+            CAST(:start AS timestamp), CAST(:end AS timestamp), interval '1 day'
+        ) AS days(day)
+        LEFT JOIN decisions
+            ON decisions.timestamp >= days.day
+            AND decisions.timestamp < days.day + interval '1 day'
+        GROUP BY days.day
+        ORDER BY days.day
+    """),
+    "sqlite": text("""
+        WITH RECURSIVE days(day) AS (
+            SELECT date(:start)
+            UNION ALL
+            SELECT date(day, '+1 day') FROM days WHERE day < date(:end)
+        )
+        SELECT days.day, count(decisions.id), avg(decisions.confidence)
+        FROM days
+        LEFT JOIN decisions
+            ON decisions.timestamp >= days.day
+            AND decisions.timestamp < date(days.day, '+1 day')
+        GROUP BY days.day
+        ORDER BY days.day
+    """),
+}
+
+
+def _daily_series(db: Session, today: datetime, days: int):
+    """Return (date, count, average confidence) for each of the last `days` days"""
+    start = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    end = today.strftime("%Y-%m-%d")
+    
+    dialect = db.bind.dialect.name
+    if dialect not in _DAILY_SERIES_SQL:
+        raise NotImplementedError(
+            f"Daily stats are not supported on the {dialect!r} database dialect "
+            f"(supported: {', '.join(sorted(_DAILY_SERIES_SQL))})"
+        )
+    
+    rows = db.execute(_DAILY_SERIES_SQL[dialect], {"start": start, "end": end})
+    return [(str(day), count, avg_conf) for day, count, avg_conf in rows]
+
 
 @router.get("/stats/overview")
-async def get_stats_overview(
+def get_stats_overview(
     days: int = Query(default=30, ge=1, le=365),
     db: Session = Depends(get_db)
 ):
@@ -26,32 +72,43 @@ async def get_stats_overview(
     
     Returns aggregated metrics about decisions over the specified time period.
     """
+    cache_key = ("overview", days)
+    cached = get_cached(stats_cache, cache_key)
+    if cached is not None:
+        return cached
+    
     # Calculate date range
-    start_date = datetime.utcnow() - timedelta(days=days)
+    now = datetime.utcnow()
+    start_date = now - timedelta(days=days)
     
-    # Base query
-    query = db.query(DecisionModel).filter(
+    # Aggregate every metric in a single pass over the filtered rows
+    sources = ['rule', 'llm', 'hybrid', 'manual']
+    row = db.query(
+        func.count(DecisionModel.id),
+        func.avg(DecisionModel.confidence),
+        func.min(DecisionModel.confidence),
+        func.sum(case((DecisionModel.confidence >= 0.8, 1), else_=0)),
+        func.sum(case(
+            ((DecisionModel.confidence >= 0.5) & (DecisionModel.confidence < 0.8), 1),
+            else_=0
+        )),
+        func.sum(case((DecisionModel.confidence < 0.5, 1), else_=0)),
+        *[
+            func.sum(case((DecisionModel.source == source, 1), else_=0))
+            for source in sources
+        ]
+    ).filter(
         DecisionModel.timestamp >= start_date
-    )
+    ).one()
     
-    # Total decisions
-    total = query.count()
-    
-    # Average confidence
-    avg_confidence = query.with_entities(
-        func.avg(DecisionModel.confidence)
-    ).scalar() or 0.0
-    
-    # Lowest confidence
-    min_confidence = query.with_entities(
-        func.min(DecisionModel.confidence)
-    ).scalar() or 0.0
+    total = row[0]
+    avg_confidence = row[1] or 0.0
+    min_confidence = row[2] or 0.0
     
     # Source distribution
     source_distribution = {}
-    for source in ['rule', 'llm', 'hybrid', 'manual']:
-        count = query.filter(DecisionModel.source == source).count()
-        if count > 0:
+    for source, count in zip(sources, row[6:]):
+        if count:
             source_distribution[source] = {
                 "count": count,
                 "percentage": round((count / total * 100) if total > 0 else 0, 2)
@@ -59,29 +116,19 @@ async def get_stats_overview(
     
     # Confidence ranges
     confidence_ranges = {
-        "high": query.filter(DecisionModel.confidence >= 0.8).count(),
-        "medium": query.filter(
-            DecisionModel.confidence >= 0.5,
-            DecisionModel.confidence < 0.8
-        ).count(),
-        "low": query.filter(DecisionModel.confidence < 0.5).count()
+        "high": row[3] or 0,
+        "medium": row[4] or 0,
+        "low": row[5] or 0
     }
     
-    # Decisions per day (last 7 days for trend)
-    daily_counts = []
-    for i in range(6, -1, -1):
-        day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=i)
-        day_end = day_start + timedelta(days=1)
-        count = db.query(DecisionModel).filter(
-            DecisionModel.timestamp >= day_start,
-            DecisionModel.timestamp < day_end
-        ).count()
-        daily_counts.append({
-            "date": day_start.strftime("%Y-%m-%d"),
-            "count": count
-        })
-    
-    return {
+    # Decisions per day (last 7 days for trend), grouped in one query
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    daily_counts = [
+        {"date": date, "count": count}
+        for date, count, _ in _daily_series(db, today, 7)
+    ]
+    
+    result = {
         "period_days": days,
         "total_decisions": total,
         "average_confidence": round(avg_confidence, 3),
@@ -90,10 +137,13 @@ async def get_stats_overview(
         "confidence_ranges": confidence_ranges,
         "daily_trend": daily_counts
     }
+    set_cached(stats_cache, cache_key, result)
+    
+    return result
 
 
 @router.get("/stats/timeline")
-async def get_stats_timeline(
+def get_stats_timeline(
     days: int = Query(default=30, ge=1, le=365),
     db: Session = Depends(get_db)
 ):
@@ -102,30 +152,26 @@ async def get_stats_timeline(
     
     Returns daily aggregated data for visualization.
     """
-    start_date = datetime.utcnow() - timedelta(days=days)
-    
-    timeline_data = []
-    for i in range(days - 1, -1, -1):
-        day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=i)
-        day_end = day_start + timedelta(days=1)
-        
-        day_query = db.query(DecisionModel).filter(
-            DecisionModel.timestamp >= day_start,
-            DecisionModel.timestamp < day_end
-        )
-        
-        count = day_query.count()
-        avg_conf = day_query.with_entities(
-            func.avg(DecisionModel.confidence)
-        ).scalar() or 0.0
-        
-        timeline_data.append({
-            "date": day_start.strftime("%Y-%m-%d"),
+    cache_key = ("timeline", days)
+    cached = get_cached(stats_cache, cache_key)
+    if cached is not None:
+        return cached
+    
+    today = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    timeline_data = [
+        {
+            "date": date,
             "count": count,
-            "average_confidence": round(avg_conf, 3)
-        })
+            "average_confidence": round(avg_conf or 0.0, 3)
+        }
+        for date, count, avg_conf in _daily_series(db, today, days)
+    ]
     
-    return {
+    result = {
         "period_days": days,
         "data": timeline_data
     }
+    set_cached(stats_cache, cache_key, result)
+    
+    return result
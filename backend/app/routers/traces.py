@@ -9,14 +9,16 @@ from sqlalchemy import func
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
 
+from app.cache import tag_cache, get_cached, set_cached
 from app.database import get_db
-from app.models import Decision as DecisionModel, DecisionStep as StepModel, DecisionSource
+from app.models import Decision as DecisionModel, DecisionStep as StepModel, DecisionTag as TagModel, DecisionSource
+from app.search import search_filter
 
 router = APIRouter()
 
 
 @router.get("/traces/stats")
-async def get_trace_statistics(
+def get_trace_statistics(
     days: int = Query(default=7, ge=1, le=365),
     db: Session = Depends(get_db)
 ):
@@ -66,7 +68,7 @@ async def get_trace_statistics(
 
 
 @router.get("/traces/timeline")
-async def get_timeline_data(
+def get_timeline_data(
     days: int = Query(default=7, ge=1, le=365),
     db: Session = Depends(get_db)
 ):
@@ -101,7 +103,7 @@ async def get_timeline_data(
 
 
 @router.get("/traces/search")
-async def search_traces(
+def search_traces(
     query: str = Query(..., min_length=1),
     limit: int = Query(default=20, ge=1, le=100),
     db: Session = Depends(get_db)
@@ -111,12 +113,9 @@ async def search_traces(
     
     Searches across reasoning, decision text, and step content.
     """
-    search_pattern = f"%{query}%"
-    
     # Search in decision reasoning and decision text
     decisions = db.query(DecisionModel).filter(
-        (DecisionModel.reasoning.ilike(search_pattern)) |
-        (DecisionModel.decision.ilike(search_pattern))
+        search_filter(db, query, columns=("reasoning", "decision"))
     ).limit(limit).all()
     
     results = []
@@ -138,24 +137,24 @@ async def search_traces(
 
 
 @router.get("/traces/tags")
-async def get_all_tags(db: Session = Depends(get_db)):
+def get_all_tags(db: Session = Depends(get_db)):
     """
     Get all unique tags used in decisions
     
     Useful for filtering and categorization.
     """
-    # Get all decisions with tags
-    decisions = db.query(DecisionModel).filter(
-        DecisionModel.tags.isnot(None)
-    ).all()
+    cached = get_cached(tag_cache, "tags")
+    if cached is not None:
+        return cached
     
-    # Collect unique tags
-    all_tags = set()
-    for decision in decisions:
-        if decision.tags:
-            all_tags.update(decision.tags)
+    rows = db.query(TagModel.tag).distinct().order_by(TagModel.tag).all()
     
-    return {
-        "tags": sorted(list(all_tags)),
+    all_tags = [row[0] for row in rows]
+    
+    result = {
+        "tags": all_tags,
         "total_unique_tags": len(all_tags)
     }
+    set_cached(tag_cache, "tags", result)
+    
+    return result
@@ -3,10 +3,12 @@ Pydantic schemas for request/response validation
 
 Strong typing ensures data integrity and provides auto-generated API documentation.
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
+import math
+import msgspec
 
 
 class DecisionSource(str, Enum):
@@ -26,6 +28,20 @@ class StepType(str, Enum):
     OUTCOME = "outcome"
 
 
+def _reject_non_finite(value):
+    """Raise if a JSON payload contains NaN or Infinity, which JSON cannot store"""
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError("NaN and Infinity are not valid JSON numbers")
+    elif isinstance(value, dict):
+        for item in value.values():
+            _reject_non_finite(item)
+    elif isinstance(value, list):
+        for item in value:
+            _reject_non_finite(item)
+    return value
+
+
 class DecisionStepBase(BaseModel):
     """Base schema for decision steps"""
     step_type: StepType
@@ -35,7 +51,11 @@ class DecisionStepBase(BaseModel):
 
 class DecisionStepCreate(DecisionStepBase):
     """Schema for creating a decision step"""
-    pass
+    
+    @field_validator("step_metadata")
+    @classmethod
+    def check_finite_metadata(cls, value):
+        return _reject_non_finite(value)
 
 
 class DecisionStep(DecisionStepBase):
@@ -59,17 +79,18 @@ class DecisionBase(BaseModel):
     outcome: Optional[str] = Field(None, max_length=500)
     outcome_data: Optional[Dict[str, Any]] = None
     tags: Optional[List[str]] = None
-    
-    @validator('confidence')
-    def validate_confidence(cls, v):
-        if not 0.0 <= v <= 1.0:
-            raise ValueError('Confidence must be between 0.0 and 1.0')
-        return round(v, 4)
 
 
 class DecisionCreate(DecisionBase):
     """Schema for creating a decision"""
     steps: Optional[List[DecisionStepCreate]] = None
+    
+    # Input-only: stored payloads were checked on the way in, so responses
+    # skip the recursive walk
+    @field_validator("input_data", "system_state", "outcome_data")
+    @classmethod
+    def check_finite_payloads(cls, value):
+        return _reject_non_finite(value)
 
 
 class Decision(DecisionBase):
@@ -99,6 +120,42 @@ class DecisionSummary(BaseModel):
         from_attributes = True
 
 
+class DecisionPage(BaseModel):
+    """Paginated list of decision summaries"""
+    decisions: List[DecisionSummary]
+    total: int
+    limit: int
+    offset: int
+    has_more: bool
+
+
+class DecisionSummaryStruct(msgspec.Struct):
+    """
+    msgspec mirror of DecisionSummary for the timeline listing hot path
+    
+    Encoded directly with msgspec.json; DecisionSummary/DecisionPage remain
+    the documented (OpenAPI) response schema.
+    """
+    id: int
+    decision_id: str
+    timestamp: datetime
+    decision: str
+    confidence: float
+    source: DecisionSource
+    outcome: Optional[str]
+    tags: Optional[List[str]]
+    step_count: int
+
+
+class DecisionPageStruct(msgspec.Struct):
+    """msgspec mirror of DecisionPage"""
+    decisions: List[DecisionSummaryStruct]
+    total: int
+    limit: int
+    offset: int
+    has_more: bool
+
+
 class DecisionReplay(BaseModel):
     """Schema for replaying a decision step-by-step"""
     decision: Decision
@@ -0,0 +1,96 @@
+"""
+Full-text search support
+
+Substring search over decision text is backed by an index on each backend:
+- SQLite: an FTS5 table with the trigram tokenizer, kept in sync by triggers
+- PostgreSQL: pg_trgm GIN indexes, which accelerate the existing ILIKE filters
+
+Both preserve the case-insensitive substring semantics of a plain ILIKE scan.
+"""
+from sqlalchemy import column, event, or_, text
+
+from app.database import Base
+from app.models import Decision as DecisionModel
+
+SEARCH_COLUMNS = ("reasoning", "decision", "outcome")
+
+# Trigram indexes cannot match terms shorter than one trigram
+MIN_INDEXED_TERM_LENGTH = 3
+
+_SQLITE_DDL = [
+    "CREATE VIRTUAL TABLE decisions_fts USING fts5("
+    "reasoning, decision, outcome, "
+    "content='decisions', content_rowid='id', tokenize='trigram')",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_ai AFTER INSERT ON decisions BEGIN "
+    "INSERT INTO decisions_fts(rowid, reasoning, decision, outcome) "
+    "VALUES (new.id, new.reasoning, new.decision, new.outcome); END",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_ad AFTER DELETE ON decisions BEGIN "
+    "INSERT INTO decisions_fts(decisions_fts, rowid, reasoning, decision, outcome) "
+    "VALUES ('delete', old.id, old.reasoning, old.decision, old.outcome); END",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_au AFTER UPDATE ON decisions BEGIN "
+    "INSERT INTO decisions_fts(decisions_fts, rowid, reasoning, decision, outcome) "
+    "VALUES ('delete', old.id, old.reasoning, old.decision, old.outcome); "
+    "INSERT INTO decisions_fts(rowid, reasoning, decision, outcome) "
+    "VALUES (new.id, new.reasoning, new.decision, new.outcome); END",
+
+    # Index rows that existed before the search table was created
+    "INSERT INTO decisions_fts(decisions_fts) VALUES ('rebuild')",
+]
+
+_POSTGRES_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+] + [
+    f"CREATE INDEX IF NOT EXISTS ix_decisions_{column}_trgm "
+    f"ON decisions USING gin ({column} gin_trgm_ops)"
+    for column in SEARCH_COLUMNS
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_index(target, connection, **kw):
+    """Create the search index alongside the tables (idempotent)"""
+    dialect = connection.dialect.name
+
+    if dialect == "sqlite":
+        exists = connection.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'decisions_fts'"
+        )).first()
+        if not exists:
+            for statement in _SQLITE_DDL:
+                connection.execute(text(statement))
+    elif dialect == "postgresql":
+        for statement in _POSTGRES_DDL:
+            connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_index(target, connection, **kw):
+    """Drop the SQLite search table so a recreated schema starts clean"""
+    if connection.dialect.name == "sqlite":
+        connection.execute(text("DROP TABLE IF EXISTS decisions_fts"))
+
+
+def search_filter(db, term: str, columns=SEARCH_COLUMNS):
+    """
+    Build a filter matching decisions whose text columns contain term
+
+    Uses the FTS5 trigram index on SQLite; elsewhere returns ILIKE filters
+    (index-assisted on PostgreSQL via pg_trgm).
+    """
+    if db.bind.dialect.name == "sqlite" and len(term) >= MIN_INDEXED_TERM_LENGTH:
+        # Restrict to the requested columns and match the term as a phrase
+        phrase = '"' + term.replace('"', '""') + '"'
+        match = "{" + " ".join(columns) + "}: " + phrase
+        return DecisionModel.id.in_(
+            text("SELECT rowid FROM decisions_fts WHERE decisions_fts MATCH :match")
+            .bindparams(match=match)
+            .columns(column("rowid"))
+        )
+
+    # Escape LIKE wildcards so the term matches literally, as it does in FTS
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    pattern = f"%{escaped}%"
+    return or_(*[getattr(DecisionModel, name).ilike(pattern, escape="\\") for name in columns])
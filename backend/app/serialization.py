@@ -0,0 +1,29 @@
+"""
+JSON encoding helpers
+
+orjson is used on the hot paths, but it refuses integers outside the 64-bit
+range. Decision payloads are arbitrary user JSON, so encoding falls back to
+the standard library whenever orjson rejects a value.
+"""
+import json
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+def dumps(value, option: int = 0) -> bytes:
+    """Encode value as JSON bytes, preferring orjson"""
+    try:
+        return orjson.dumps(value, option=option)
+    except TypeError:
+        # orjson.JSONEncodeError subclasses TypeError
+        if option & orjson.OPT_INDENT_2:
+            return json.dumps(value, ensure_ascii=False, indent=2).encode()
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class JSONResponse(ORJSONResponse):
+    """ORJSONResponse that still renders payloads orjson cannot encode"""
+    
+    def render(self, content) -> bytes:
+        return dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
@@ -4,10 +4,39 @@ Decision Engine Service
 Example service showing how to integrate decision-making logic with the trace system.
 This demonstrates how real AI systems would use the timeline.
 """
-from typing import Dict, Any, Tuple
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+import ahocorasick
 from app.schemas import DecisionCreate, DecisionSource
 
 
+@dataclass(frozen=True)
+class RefundRule:
+    """Auto-approve refunds for trusted users under a limit"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("user_tier", "amount_max", "refund_count_max", "confidence")
+    
+    user_tier: str
+    amount_max: float
+    refund_count_max: int
+    confidence: float
+
+
+@dataclass(frozen=True)
+class EscalationRule:
+    """Escalate support tickets mentioning sensitive keywords"""
+    __slots__ = ("keywords", "urgency", "confidence")
+    
+    keywords: Tuple[str, ...]
+    urgency: str
+    confidence: float
+
+
+Rule = Union[RefundRule, EscalationRule]
+
+
 class DecisionEngine:
     """
     Example decision engine that makes decisions and creates trace data
@@ -19,33 +48,102 @@ class DecisionEngine:
     - Business logic
     """
     
+    # Amount tiers: <= 100 is low, <= 1000 is medium, above is high
+    _AMOUNT_THRESHOLDS = (100.0, 1000.0)
+    _AMOUNT_TAGS = ("low_value", "medium_value", "high_value")
+    
     def __init__(self):
         self.rules = self._load_rules()
+        self._compiled_rules = self._compile_rules(self.rules)
+        # Bounded per-instance memo of outcomes for recurring inputs; typed, so
+        # 50, 50.0 and True (equal as keys) keep their own reasoning text
+        self._decide_cached = lru_cache(maxsize=256, typed=True)(self._decide)
     
-    def _load_rules(self) -> Dict[str, Any]:
+    def _load_rules(self) -> Dict[str, Rule]:
         """
         Load decision rules
         
         In production, this would come from a database or config file.
         """
         return {
-            "refund_auto_approve": {
-                "conditions": {
-                    "user_tier": "premium",
-                    "amount_max": 100.0,
-                    "refund_count_max": 2
-                },
-                "confidence": 0.95
-            },
-            "support_escalation": {
-                "conditions": {
-                    "keywords": ["legal", "lawsuit", "attorney", "fraud"],
-                    "urgency": "high"
-                },
-                "confidence": 0.98
-            }
+            "refund_auto_approve": RefundRule(
+                user_tier="premium",
+                amount_max=100.0,
+                refund_count_max=2,
+                confidence=0.95
+            ),
+            "support_escalation": EscalationRule(
+                keywords=("legal", "lawsuit", "attorney", "fraud"),
+                urgency="high",
+                confidence=0.98
+            )
+        }
+    
+    def _compile_rules(self, rules: Dict[str, Rule]) -> Dict[str, List[Callable]]:
+        """
+        Compile rules into matcher closures, grouped by request type
+        
+        Each matcher closes over its rule's constants and returns a
+        (decision, source, confidence, reasoning) tuple, or None. A request
+        only runs the matchers registered for its type, in order.
+        """
+        return {
+            "refund": [self._compile_refund_rule(rules["refund_auto_approve"])],
+            "support_ticket": [self._compile_escalation_rule(rules["support_escalation"])],
         }
     
+    @staticmethod
+    def _compile_refund_rule(rule: RefundRule) -> Callable:
+        """Compile the refund auto-approval rule"""
+        tier = rule.user_tier
+        amount_max = rule.amount_max
+        refund_count_max = rule.refund_count_max
+        confidence = rule.confidence
+        
+        def match(user_tier, amount, refund_count, message):
+            if (
+                user_tier == tier and
+                (amount if amount is not None else 0) <= amount_max and
+                refund_count <= refund_count_max
+            ):
+                return (
+                    "approve_refund",
+                    DecisionSource.RULE,
+                    confidence,
+                    f"Auto-approved: User is {tier} tier with good history. "
+                    f"Amount ${amount} is within auto-approval limit."
+                )
+            return None
+        
+        return match
+    
+    @classmethod
+    def _compile_escalation_rule(cls, rule: EscalationRule) -> Callable:
+        """Compile the support escalation rule"""
+        automaton = cls._build_keyword_automaton(rule.keywords)
+        result = (
+            "escalate_to_human",
+            DecisionSource.RULE,
+            rule.confidence,
+            "Escalating to human agent: Message contains sensitive keywords requiring human review."
+        )
+        
+        def match(user_tier, amount, refund_count, message):
+            if next(automaton.iter(message), None) is not None:
+                return result
+            return None
+        
+        return match
+    
+    @staticmethod
+    def _build_keyword_automaton(keywords) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton matching any of the keywords in one pass"""
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return automaton
+    
     def make_decision(
         self,
         input_data: Dict[str, Any],
@@ -56,9 +154,19 @@ class DecisionEngine:
         
         Returns a DecisionCreate object ready to be stored.
         """
-        # Try rule-based decision first
-        decision, source, confidence, reasoning = self._try_rule_based(
-            input_data, system_state
+        request_type = input_data.get("request_type")
+        message = None
+        if request_type == "support_ticket":
+            # Lowercased inside the memoized call, so cache hits skip it
+            message = input_data.get("message", "")
+        
+        # Try rule-based decision first (memoized on the rule inputs)
+        decision, source, confidence, reasoning, tags = self._decide_cached(
+            request_type,
+            system_state.get("user_tier"),
+            input_data.get("amount"),
+            system_state.get("refund_count", 0),
+            message
         )
         
         # If no rule matches, could call LLM here
@@ -74,47 +182,49 @@ class DecisionEngine:
             decision=decision,
             confidence=confidence,
             source=source,
-            tags=self._generate_tags(input_data)
+            tags=list(tags)
+        )
+    
+    def _decide(
+        self,
+        request_type: Optional[str],
+        user_tier: Optional[str],
+        amount: Optional[float],
+        refund_count: int,
+        message: Optional[str]
+    ) -> Tuple[Optional[str], Optional[DecisionSource], Optional[float], Optional[str], Tuple[str, ...]]:
+        """
+        Evaluate rules and tags from the decision-relevant fields only
+        
+        Memoized per instance, so recurring inputs skip rule evaluation.
+        """
+        if message is not None:
+            message = message.lower()
+        
+        decision, source, confidence, reasoning = self._try_rule_based(
+            request_type, user_tier, amount, refund_count, message
+        )
+        
+        return (
+            decision, source, confidence, reasoning,
+            tuple(self._generate_tags(request_type, amount))
         )
     
     def _try_rule_based(
         self,
-        input_data: Dict[str, Any],
-        system_state: Dict[str, Any]
+        request_type: Optional[str],
+        user_tier: Optional[str],
+        amount: Optional[float],
+        refund_count: int,
+        message: Optional[str]
     ) -> Tuple[str, DecisionSource, float, str]:
         """
-        Attempt to make decision using rules
+        Attempt to make decision using the compiled rules
         """
-        # Example: Refund auto-approval
-        if input_data.get("request_type") == "refund":
-            rule = self.rules["refund_auto_approve"]
-            conditions = rule["conditions"]
-            
-            if (
-                system_state.get("user_tier") == conditions["user_tier"] and
-                input_data.get("amount", 0) <= conditions["amount_max"] and
-                system_state.get("refund_count", 0) <= conditions["refund_count_max"]
-            ):
-                return (
-                    "approve_refund",
-                    DecisionSource.RULE,
-                    rule["confidence"],
-                    f"Auto-approved: User is {conditions['user_tier']} tier with good history. "
-                    f"Amount ${input_data.get('amount')} is within auto-approval limit."
-                )
-        
-        # Example: Support escalation
-        if input_data.get("request_type") == "support_ticket":
-            message = input_data.get("message", "").lower()
-            rule = self.rules["support_escalation"]
-            
-            if any(keyword in message for keyword in rule["conditions"]["keywords"]):
-                return (
-                    "escalate_to_human",
-                    DecisionSource.RULE,
-                    rule["confidence"],
-                    f"Escalating to human agent: Message contains sensitive keywords requiring human review."
-                )
+        for match in self._compiled_rules.get(request_type, ()):
+            result = match(user_tier, amount, refund_count, message)
+            if result is not None:
+                return result
         
         return None, None, None, None
     
@@ -135,20 +245,11 @@ class DecisionEngine:
             "No automatic decision rule matched. Routing to manual review queue."
         )
     
-    def _generate_tags(self, input_data: Dict[str, Any]) -> list:
+    def _generate_tags(self, request_type: Optional[str], amount: Optional[float]) -> list:
         """Generate tags for categorization"""
-        tags = []
-        
-        if "request_type" in input_data:
-            tags.append(input_data["request_type"])
-        
-        if "amount" in input_data:
-            amount = input_data["amount"]
-            if amount > 1000:
-                tags.append("high_value")
-            elif amount > 100:
-                tags.append("medium_value")
-            else:
-                tags.append("low_value")
+        tags = [request_type] if request_type is not None else []
+        
+        if amount is not None:
+            tags.append(self._AMOUNT_TAGS[bisect_left(self._AMOUNT_THRESHOLDS, amount)])
         
         return tags
@@ -4,10 +4,27 @@ Trace Builder Service
 Automatically generates decision steps from decision data.
 This is used when steps are not explicitly provided.
 """
-from typing import List
+from itertools import islice
+import re
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
+from cachetools import LRUCache
+import orjson
 from app.schemas import DecisionCreate, DecisionStepCreate, StepType
 
+# Values orjson would coerce lossily (dates, subclasses, dataclasses) raise
+# instead, so such decisions bypass the step cache
+_CACHE_KEY_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_SUBCLASS
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+# Constant step metadata shared by every generated trace; treat as read-only
+_AUTO_GENERATED_METADATA = {"auto_generated": True}
+_EMPTY_METADATA = {}
+
 
 class TraceBuilder:
     """
@@ -16,74 +33,105 @@ class TraceBuilder:
     Converts decision metadata into a sequence of human-readable steps.
     """
     
+    # Action keywords in priority order, matched in a single regex scan
+    _ACTION_KEYWORDS = ("approve", "reject", "deny", "escalate", "route")
+    _ACTION_RE = re.compile("|".join(_ACTION_KEYWORDS))
+    _ACTION_MAP = {
+        "approve": "Executing approval workflow",
+        "reject": "Executing rejection workflow",
+        "deny": "Executing rejection workflow",
+        "escalate": "Escalating to human review",
+        "route": "Routing to appropriate handler",
+    }
+    
     def build_steps(self, decision: DecisionCreate) -> List[DecisionStepCreate]:
         """
         Generate decision steps from decision data
         
         Creates a logical sequence: Input → Reasoning → Decision → Action → Outcome
         """
+        return list(self._assemble_steps(
+            decision.input_data, decision.system_state, decision.reasoning,
+            decision.decision, decision.confidence, decision.source.value,
+            decision.outcome, decision.outcome_data
+        ))
+    
+    def _assemble_steps(
+        self,
+        input_data: Dict[str, Any],
+        system_state: Optional[Dict[str, Any]],
+        reasoning: str,
+        decision_text: str,
+        confidence: float,
+        source_value: str,
+        outcome: Optional[str],
+        outcome_data: Optional[Dict[str, Any]]
+    ) -> Tuple[DecisionStepCreate, ...]:
+        """Assemble the step sequence from individual decision fields"""
+        # Step fields derive from an already-validated DecisionCreate, so the
+        # steps are built with model_construct and skip re-validation
         steps = []
         
         # Step 1: Input
-        input_summary = self._summarize_input(decision.input_data)
-        steps.append(DecisionStepCreate(
+        input_summary = self._summarize_input(input_data)
+        steps.append(DecisionStepCreate.model_construct(
             step_type=StepType.INPUT,
             content=f"Input received: {input_summary}",
-            step_metadata={"input_data": decision.input_data}
+            step_metadata={"input_data": input_data}
         ))
         
         # Step 2: Reasoning (if system state exists, include it)
-        if decision.system_state:
-            state_summary = self._summarize_state(decision.system_state)
-            steps.append(DecisionStepCreate(
+        if system_state:
+            state_summary = self._summarize_state(system_state)
+            steps.append(DecisionStepCreate.model_construct(
                 step_type=StepType.REASONING,
                 content=f"System state: {state_summary}",
-                step_metadata={"system_state": decision.system_state}
+                step_metadata={"system_state": system_state}
             ))
         
         # Step 3: Reasoning - Main logic
-        steps.append(DecisionStepCreate(
+        steps.append(DecisionStepCreate.model_construct(
             step_type=StepType.REASONING,
-            content=decision.reasoning,
+            content=reasoning,
             step_metadata={
-                "source": decision.source.value,
-                "confidence": decision.confidence
+                "source": source_value,
+                "confidence": confidence
             }
         ))
         
         # Step 4: Decision
-        decision_content = f"Decision: {decision.decision}"
-        if decision.confidence < 0.7:
+        decision_content = f"Decision: {decision_text}"
+        if confidence < 0.7:
             decision_content += " (Low confidence - may require review)"
         
-        steps.append(DecisionStepCreate(
+        steps.append(DecisionStepCreate.model_construct(
             step_type=StepType.DECISION,
             content=decision_content,
             step_metadata={
-                "decision": decision.decision,
-                "confidence": decision.confidence,
-                "source": decision.source.value
+                "decision": decision_text,
+                "confidence": confidence,
+                "source": source_value
             }
         ))
         
         # Step 5: Action (implicit - what happens next)
-        action_content = self._generate_action(decision)
+        action_content = self._generate_action(decision_text)
         if action_content:
-            steps.append(DecisionStepCreate(
+            steps.append(DecisionStepCreate.model_construct(
                 step_type=StepType.ACTION,
                 content=action_content,
-                step_metadata={"auto_generated": True}
+                step_metadata=_AUTO_GENERATED_METADATA
             ))
         
         # Step 6: Outcome (if provided)
-        if decision.outcome:
-            steps.append(DecisionStepCreate(
+        if outcome:
+            steps.append(DecisionStepCreate.model_construct(
                 step_type=StepType.OUTCOME,
-                content=decision.outcome,
-                step_metadata=decision.outcome_data or {}
+                content=outcome,
+                step_metadata=outcome_data or _EMPTY_METADATA
             ))
         
-        return steps
+        return tuple(steps)
     
     def _summarize_input(self, input_data: dict) -> str:
         """Create human-readable summary of input data"""
@@ -92,46 +140,74 @@ class TraceBuilder:
         
         # Try to create a natural language summary
         if len(input_data) == 1:
-            key, value = list(input_data.items())[0]
+            key, value = next(iter(input_data.items()))
             return f"{key} = {value}"
         
-        summary_parts = []
-        for key, value in list(input_data.items())[:3]:  # First 3 items
-            summary_parts.append(f"{key}={value}")
-        
-        result = ", ".join(summary_parts)
+        head = ", ".join(f"{key}={value}" for key, value in islice(input_data.items(), 3))
         if len(input_data) > 3:
-            result += f", +{len(input_data) - 3} more"
-        
-        return result
+            return f"{head}, +{len(input_data) - 3} more"
+        return head
     
     def _summarize_state(self, system_state: dict) -> str:
         """Create human-readable summary of system state"""
         if not system_state:
             return "No state data"
         
-        summary_parts = []
-        for key, value in list(system_state.items())[:3]:
-            summary_parts.append(f"{key}={value}")
-        
-        result = ", ".join(summary_parts)
+        head = ", ".join(f"{key}={value}" for key, value in islice(system_state.items(), 3))
         if len(system_state) > 3:
-            result += f", +{len(system_state) - 3} more"
-        
-        return result
+            return f"{head}, +{len(system_state) - 3} more"
+        return head
     
-    def _generate_action(self, decision: DecisionCreate) -> str:
+    def _generate_action(self, decision_text: str) -> str:
         """Generate action text based on decision"""
         # This is a simple heuristic - can be extended
-        decision_text = decision.decision.lower()
-        
-        if "approve" in decision_text:
-            return "Executing approval workflow"
-        elif "reject" in decision_text or "deny" in decision_text:
-            return "Executing rejection workflow"
-        elif "escalate" in decision_text:
-            return "Escalating to human review"
-        elif "route" in decision_text:
-            return "Routing to appropriate handler"
-        else:
+        found = self._ACTION_RE.findall(decision_text.lower())
+        if not found:
             return "Executing decision action"
+        
+        # Earlier keywords win when several appear
+        return self._ACTION_MAP[min(found, key=self._ACTION_KEYWORDS.index)]
+
+
+class CachedTraceBuilder(TraceBuilder):
+    """
+    TraceBuilder that memoizes steps for repeated decision content
+    
+    Only worth it where the same payloads recur, such as replaying or
+    backfilling stored decisions; freshly created decisions are almost always
+    unique, so the request path uses a plain TraceBuilder. Cached steps share
+    their metadata dicts with the decision that first produced them, so
+    payloads must not be mutated after their steps are built.
+    """
+    
+    def __init__(self, maxsize: int = 1024):
+        self._steps_cache = LRUCache(maxsize=maxsize)
+        # LRUCache is not thread-safe, and reads reorder it
+        self._lock = threading.Lock()
+    
+    def build_steps(self, decision: DecisionCreate) -> List[DecisionStepCreate]:
+        try:
+            key = (
+                orjson.dumps(decision.input_data, option=_CACHE_KEY_OPTIONS),
+                orjson.dumps(decision.system_state, option=_CACHE_KEY_OPTIONS),
+                decision.reasoning, decision.decision, decision.confidence,
+                decision.source.value, decision.outcome,
+                orjson.dumps(decision.outcome_data, option=_CACHE_KEY_OPTIONS)
+            )
+        except TypeError:
+            return super().build_steps(decision)
+        
+        with self._lock:
+            steps = self._steps_cache.get(key)
+        if steps is None:
+            # Built from the original dicts; the key is only used for lookup
+            steps = self._assemble_steps(
+                decision.input_data, decision.system_state, decision.reasoning,
+                decision.decision, decision.confidence, decision.source.value,
+                decision.outcome, decision.outcome_data
+            )
+            with self._lock:
+                self._steps_cache[key] = steps
+        
+        # Cached steps are shared, so hand each caller its own list
+        return list(steps)
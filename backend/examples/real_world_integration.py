@@ -8,11 +8,30 @@ This example shows how to integrate the decision timeline with:
 
 This demonstrates how production AI systems can use the timeline for explainability.
 """
+import asyncio
+import importlib.util
 import os
-from typing import Dict, Any, Tuple
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from app.schemas import DecisionCreate, DecisionSource
 from app.services.trace_builder import TraceBuilder
+import ahocorasick
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+
+# Decisions queued while a post is in flight are shipped together, up to this many
+LOG_BATCH_SIZE = 32
+# Timeout for each logging HTTP call, and for a caller waiting on its result
+LOG_REQUEST_TIMEOUT_SECONDS = 10.0
+LOG_RESULT_TIMEOUT_SECONDS = 15.0
+
+# Queue sentinel telling the logging worker to exit
+_STOP = object()
 
 # Example: Simulated OpenAI integration (replace with actual API calls)
 class AIDecisionSystem:
@@ -22,6 +41,7 @@ class AIDecisionSystem:
     
     def __init__(self, api_base_url: str = "http://localhost:8000/api"):
         self.api_base_url = api_base_url
+        self._batch_url = f"{api_base_url}/decisions/batch"
         self.trace_builder = TraceBuilder()
         
         # Initialize decision rules
@@ -39,6 +59,59 @@ class AIDecisionSystem:
                 "confidence": 0.98
             }
         }
+        
+        # Precompile rules into matcher closures over their constants
+        self._compiled_rules = self._compile_rules()
+        
+        # Bounded memo of rule outcomes for recurring request profiles (typed,
+        # since the reasoning text formats the amount as given)
+        self._rule_decision_cached = lru_cache(maxsize=256, typed=True)(self._try_rule_based)
+        
+        # Pooled keep-alive connections to the timeline API
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # Background worker that posts queued decisions in batches; started
+        # on first use and stopped by close()
+        self._log_queue: "queue.Queue[Tuple[DecisionCreate, Future]]" = queue.Queue()
+        self._log_worker: Optional[threading.Thread] = None
+        self._log_worker_lock = threading.Lock()
+        
+        # Non-blocking client for async callers (e.g. FastAPI handlers);
+        # HTTP/2 is used when the optional h2 package is installed
+        self._async_client = httpx.AsyncClient(
+            base_url=api_base_url,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+    
+    def __enter__(self) -> "AIDecisionSystem":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "AIDecisionSystem":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    def close(self) -> None:
+        """Flush queued decisions, stop the logging worker and close the HTTP session"""
+        with self._log_worker_lock:
+            worker, self._log_worker = self._log_worker, None
+        if worker is not None:
+            self._log_queue.put(_STOP)
+            worker.join()
+        self._session.close()
+    
+    async def aclose(self) -> None:
+        """Close both HTTP clients and stop the logging worker"""
+        await asyncio.to_thread(self.close)
+        await self._async_client.aclose()
     
     def process_customer_request(
         self,
@@ -51,12 +124,59 @@ class AIDecisionSystem:
         
         This is the main entry point that would be called by your application.
         """
-        # Step 1: Try rule-based decision first
-        decision, source, confidence, reasoning = self._try_rule_based(
-            request_type, user_data, request_data
+        decision_record = self._decide(request_type, user_data, request_data)
+        
+        # Step 4: Log to timeline API
+        # The timeline URL needs the server-assigned ID, so wait for the post
+        try:
+            response = self._log_decision(decision_record).result(
+                timeout=LOG_RESULT_TIMEOUT_SECONDS
+            )
+        except FutureTimeoutError:
+            print("Failed to log decision: timed out")
+            response = {}
+        
+        return self._build_result(decision_record, response)
+    
+    async def aprocess_customer_request(
+        self,
+        request_type: str,
+        user_data: Dict[str, Any],
+        request_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of process_customer_request for event-loop callers
+        
+        Logging awaits the HTTP call instead of blocking, so many requests can
+        be in flight at once (e.g. via asyncio.gather).
+        """
+        decision_record = self._decide(request_type, user_data, request_data)
+        response = await self._alog_decision(decision_record)
+        
+        return self._build_result(decision_record, response)
+    
+    def _decide(
+        self,
+        request_type: str,
+        user_data: Dict[str, Any],
+        request_data: Dict[str, Any]
+    ) -> DecisionCreate:
+        """Make the decision and build its record (steps 1-3)"""
+        # Step 1: Try rule-based decision first (memoized on the rule inputs)
+        message = None
+        if request_type == "support_ticket":
+            # Lowercased inside the memoized call, so cache hits skip it
+            message = request_data.get("message", "")
+        
+        decision, source, confidence, reasoning = self._rule_decision_cached(
+            request_type,
+            user_data.get("tier"),
+            request_data.get("amount", 0),
+            user_data.get("refund_count", 0),
+            message
         )
         
-        # Step 2: If no rule matches, use LLM
+        # Step 2: If no rule matches, use LLM (not cached: it sees the full request)
         if decision is None:
             decision, source, confidence, reasoning = self._llm_decision(
                 request_type, user_data, request_data
@@ -80,13 +200,18 @@ class AIDecisionSystem:
             tags=[request_type, source.value]
         )
         
-        # Step 4: Log to timeline API
-        response = self._log_decision(decision_record)
-        
+        return decision_record
+    
+    def _build_result(
+        self,
+        decision_record: DecisionCreate,
+        response: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Combine the decision with the logged record's ID"""
         return {
-            "decision": decision,
-            "confidence": confidence,
-            "reasoning": reasoning,
+            "decision": decision_record.decision,
+            "confidence": decision_record.confidence,
+            "reasoning": decision_record.reasoning,
             "decision_id": response.get("decision_id"),
             "timeline_url": f"{self.api_base_url}/decisions/{response.get('decision_id')}"
         }
@@ -94,43 +219,73 @@ class AIDecisionSystem:
     def _try_rule_based(
         self,
         request_type: str,
-        user_data: Dict[str, Any],
-        request_data: Dict[str, Any]
+        tier: Optional[str],
+        amount: float,
+        refund_count: int,
+        message: Optional[str]
     ) -> Tuple[str, DecisionSource, float, str]:
         """
-        Attempt to make decision using rules
+        Attempt to make decision using the compiled rules
         """
+        if message is not None:
+            message = message.lower()
+        
+        for match in self._compiled_rules:
+            result = match(request_type, tier, amount, refund_count, message)
+            if result is not None:
+                return result
+        
+        return None, None, None, None
+    
+    def _compile_rules(self) -> List[Callable]:
+        """
+        Compile self.rules into matchers returning a decision tuple or None
+        """
+        refund_rule = self.rules["auto_approve_refund"]
+        required_tier = refund_rule["conditions"]["required_tier"]
+        max_amount = refund_rule["conditions"]["max_amount"]
+        max_refund_count = refund_rule["conditions"]["max_refund_count"]
+        refund_confidence = refund_rule["confidence"]
+        
         # Rule: Auto-approve refunds
-        if request_type == "refund":
-            rule = self.rules["auto_approve_refund"]
-            amount = request_data.get("amount", 0)
-            
+        def match_refund(request_type, tier, amount, refund_count, message):
             if (
-                user_data.get("tier") == rule["conditions"]["required_tier"] and
-                amount <= rule["conditions"]["max_amount"] and
-                user_data.get("refund_count", 0) <= rule["conditions"]["max_refund_count"]
+                request_type == "refund" and
+                tier == required_tier and
+                amount <= max_amount and
+                refund_count <= max_refund_count
             ):
                 return (
                     "approve_refund",
                     DecisionSource.RULE,
-                    rule["confidence"],
+                    refund_confidence,
                     f"Auto-approved: Premium user, amount ${amount} within limit, low refund history"
                 )
+            return None
+        
+        # Match all legal keywords as substrings in a single pass over the
+        # message, so inflections ("attorneys", "sued") still escalate
+        legal_ac = ahocorasick.Automaton()
+        for keyword in self.rules["escalate_legal"]["keywords"]:
+            legal_ac.add_word(keyword, keyword)
+        legal_ac.make_automaton()
+        legal_result = (
+            "escalate_to_legal",
+            DecisionSource.RULE,
+            self.rules["escalate_legal"]["confidence"],
+            "Legal keywords detected. Escalating to legal team per compliance policy."
+        )
         
         # Rule: Escalate legal issues
-        if request_type == "support_ticket":
-            message = request_data.get("message", "").lower()
-            rule = self.rules["escalate_legal"]
-            
-            if any(keyword in message for keyword in rule["keywords"]):
-                return (
-                    "escalate_to_legal",
-                    DecisionSource.RULE,
-                    rule["confidence"],
-                    "Legal keywords detected. Escalating to legal team per compliance policy."
-                )
+        def match_legal(request_type, tier, amount, refund_count, message):
+            if (
+                request_type == "support_ticket" and
+                next(legal_ac.iter(message), None) is not None
+            ):
+                return legal_result
+            return None
         
-        return None, None, None, None
+        return [match_refund, match_legal]
     
     def _llm_decision(
         self,
@@ -175,20 +330,90 @@ class AIDecisionSystem:
             f"No clear rule applies. LLM recommends human review for {request_type}."
         )
     
-    def _log_decision(self, decision: DecisionCreate) -> Dict[str, Any]:
+    def _log_decision(self, decision: DecisionCreate) -> "Future[Dict[str, Any]]":
+        """
+        Queue a decision for logging to the timeline API
+        
+        Returns a future resolving to the created record ({} on failure).
         """
-        Log decision to the timeline API
+        with self._log_worker_lock:
+            if self._log_worker is None:
+                self._log_worker = threading.Thread(target=self._drain_loop, daemon=True)
+                self._log_worker.start()
+        
+        future: "Future[Dict[str, Any]]" = Future()
+        self._log_queue.put((decision, future))
+        return future
+    
+    async def _alog_decision(self, decision: DecisionCreate) -> Dict[str, Any]:
+        """
+        Log decision to the timeline API without blocking the event loop
         """
         try:
-            response = requests.post(
-                f"{self.api_base_url}/decisions",
-                json=decision.dict()
+            response = await self._async_client.post(
+                "/decisions",
+                content=orjson.dumps(decision.model_dump(mode="json")),
+                headers={"Content-Type": "application/json"},
+                timeout=LOG_REQUEST_TIMEOUT_SECONDS
             )
             response.raise_for_status()
             return response.json()
         except Exception as e:
             print(f"Failed to log decision: {e}")
             return {}
+    
+    def _drain_loop(self) -> None:
+        """
+        Post queued decisions until close() is called
+        
+        Never waits for a batch to fill: a lone decision is posted at once,
+        and anything that queued up during the previous post goes out together.
+        """
+        while True:
+            item = self._log_queue.get()
+            if item is _STOP:
+                return
+            batch = [item]
+            
+            while len(batch) < LOG_BATCH_SIZE:
+                try:
+                    item = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    self._post_batch(batch)
+                    return
+                batch.append(item)
+            
+            self._post_batch(batch)
+    
+    def _post_batch(self, batch) -> None:
+        """Post a batch of decisions and resolve their futures"""
+        try:
+            # Serialize once with orjson instead of dict() + stdlib json
+            payload = orjson.dumps([
+                decision.model_dump(mode="json") for decision, _ in batch
+            ])
+            response = self._session.post(
+                self._batch_url,
+                data=payload,
+                headers={"Content-Type": "application/json"},
+                timeout=LOG_REQUEST_TIMEOUT_SECONDS
+            )
+            if response.status_code == 422 and len(batch) > 1:
+                # One invalid decision rejects the whole batch; resend them
+                # individually so only that decision fails
+                for item in batch:
+                    self._post_batch([item])
+                return
+            response.raise_for_status()
+            results = response.json()
+        except Exception as e:
+            print(f"Failed to log decisions: {e}")
+            results = [{}] * len(batch)
+        
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
 
 
 # Example Usage
@@ -270,6 +495,28 @@ if __name__ == "__main__":
     print(f"View in timeline: {result.get('timeline_url')}")
     print()
     
+    ai_system.close()
+    
+    # Example 4: Concurrent requests from async code
+    print("=" * 60)
+    print("Example 4: Concurrent Async Requests")
+    print("=" * 60)
+    
+    async def process_concurrently():
+        async with AIDecisionSystem() as async_system:
+            return await asyncio.gather(*[
+                async_system.aprocess_customer_request(
+                    request_type="refund",
+                    user_data={"user_id": f"user_{i}", "tier": "premium", "refund_count": 0},
+                    request_data={"amount": 20.0 + i, "order_id": f"ORD-{9000 + i}"}
+                )
+                for i in range(5)
+            ])
+    
+    for result in asyncio.run(process_concurrently()):
+        print(f"{result['decision']} -> {result.get('timeline_url')}")
+    print()
+    
     print("=" * 60)
     print("[OK] All decisions logged to timeline!")
     print("View them at: http://localhost:3000")
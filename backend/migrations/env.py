@@ -0,0 +1,61 @@
+"""
+Alembic migration environment
+
+Runs migrations against the application's configured engine.
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import Base, engine
+import app.models  # noqa: F401  (register tables on Base.metadata)
+import app.search  # noqa: F401  (register search index DDL)
+
+if context.config.config_file_name is not None:
+    fileConfig(context.config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def include_name(name, type_, parent_names):
+    """Hide the search index objects from autogenerate; migrations own them"""
+    if type_ == "table":
+        # The SQLite FTS table and its shadow tables (decisions_fts_data, ...)
+        return not name.startswith("decisions_fts")
+    if type_ == "index":
+        # The PostgreSQL pg_trgm indexes
+        return not name.endswith("_trgm")
+    return True
+
+
+def run_migrations_offline():
+    """Emit migration SQL without a database connection"""
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Run migrations on a live connection"""
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
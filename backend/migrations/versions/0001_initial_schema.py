@@ -0,0 +1,130 @@
+"""
+Initial schema
+
+Creates the decision tables, their indexes and the dialect-specific search
+index. The DDL is spelled out here rather than taken from the models, so the
+revision stays fixed as the models evolve.
+
+Databases created before migrations were introduced (by create_all) are
+upgraded in place: tables that already exist are kept, and any missing
+indexes and search objects are added.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+decision_source = sa.Enum("RULE", "LLM", "HYBRID", "MANUAL", name="decisionsource")
+step_type = sa.Enum("INPUT", "REASONING", "DECISION", "ACTION", "OUTCOME", name="steptype")
+
+_SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE decisions_fts USING fts5("
+    "reasoning, decision, outcome, "
+    "content='decisions', content_rowid='id', tokenize='trigram')",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_ai AFTER INSERT ON decisions BEGIN "
+    "INSERT INTO decisions_fts(rowid, reasoning, decision, outcome) "
+    "VALUES (new.id, new.reasoning, new.decision, new.outcome); END",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_ad AFTER DELETE ON decisions BEGIN "
+    "INSERT INTO decisions_fts(decisions_fts, rowid, reasoning, decision, outcome) "
+    "VALUES ('delete', old.id, old.reasoning, old.decision, old.outcome); END",
+
+    "CREATE TRIGGER IF NOT EXISTS decisions_fts_au AFTER UPDATE ON decisions BEGIN "
+    "INSERT INTO decisions_fts(decisions_fts, rowid, reasoning, decision, outcome) "
+    "VALUES ('delete', old.id, old.reasoning, old.decision, old.outcome); "
+    "INSERT INTO decisions_fts(rowid, reasoning, decision, outcome) "
+    "VALUES (new.id, new.reasoning, new.decision, new.outcome); END",
+
+    # Index rows that existed before the search table was created
+    "INSERT INTO decisions_fts(decisions_fts) VALUES ('rebuild')",
+]
+
+_POSTGRES_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+] + [
+    f"CREATE INDEX IF NOT EXISTS ix_decisions_{column}_trgm "
+    f"ON decisions USING gin ({column} gin_trgm_ops)"
+    for column in ("reasoning", "decision", "outcome")
+]
+
+
+def upgrade():
+    bind = op.get_bind()
+    # Offline (--sql) runs cannot inspect, so they emit the full schema
+    existing = set() if op.get_context().as_sql else set(sa.inspect(bind).get_table_names())
+
+    if "decisions" not in existing:
+        op.create_table(
+            "decisions",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("decision_id", sa.String(), nullable=False),
+            sa.Column("timestamp", sa.DateTime(), nullable=False),
+            sa.Column("input_data", sa.JSON(), nullable=False),
+            sa.Column("system_state", sa.JSON(), nullable=True),
+            sa.Column("reasoning", sa.Text(), nullable=False),
+            sa.Column("decision", sa.String(), nullable=False),
+            sa.Column("confidence", sa.Float(), nullable=False),
+            sa.Column("source", decision_source, nullable=False),
+            sa.Column("outcome", sa.String(), nullable=True),
+            sa.Column("outcome_data", sa.JSON(), nullable=True),
+            sa.Column("tags", sa.JSON(), nullable=True),
+        )
+
+    if "decision_steps" not in existing:
+        op.create_table(
+            "decision_steps",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("decision_id", sa.Integer(), sa.ForeignKey("decisions.id"), nullable=False),
+            sa.Column("step_order", sa.Integer(), nullable=False),
+            sa.Column("step_type", step_type, nullable=False),
+            sa.Column("timestamp", sa.DateTime(), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("step_metadata", sa.JSON(), nullable=True),
+        )
+
+    if "decision_tags" not in existing:
+        op.create_table(
+            "decision_tags",
+            sa.Column("decision_id", sa.Integer(), sa.ForeignKey("decisions.id"), primary_key=True),
+            sa.Column("tag", sa.String(), primary_key=True),
+        )
+
+    op.create_index("ix_decisions_id", "decisions", ["id"], if_not_exists=True)
+    op.create_index("ix_decisions_decision_id", "decisions", ["decision_id"], unique=True, if_not_exists=True)
+    op.create_index("ix_decisions_ts", "decisions", [sa.text("timestamp DESC")], if_not_exists=True)
+    op.create_index("ix_decisions_source_ts", "decisions", ["source", "timestamp"], if_not_exists=True)
+    op.create_index("ix_decisions_conf_ts", "decisions", ["confidence", "timestamp"], if_not_exists=True)
+    op.create_index("ix_decision_steps_id", "decision_steps", ["id"], if_not_exists=True)
+    op.create_index("ix_decision_steps_decision_id", "decision_steps", ["decision_id"], if_not_exists=True)
+    op.create_index("ix_decision_tags_tag", "decision_tags", ["tag", "decision_id"], if_not_exists=True)
+
+    if bind.dialect.name == "sqlite":
+        if "decisions_fts" not in existing:
+            for statement in _SQLITE_SEARCH_DDL:
+                op.execute(statement)
+    elif bind.dialect.name == "postgresql":
+        for statement in _POSTGRES_SEARCH_DDL:
+            op.execute(statement)
+
+
+def downgrade():
+    bind = op.get_bind()
+
+    if bind.dialect.name == "sqlite":
+        # The search triggers are dropped along with the decisions table
+        op.execute("DROP TABLE IF EXISTS decisions_fts")
+
+    op.drop_table("decision_tags")
+    op.drop_table("decision_steps")
+    op.drop_table("decisions")
+
+    step_type.drop(bind, checkfirst=True)
+    decision_source.drop(bind, checkfirst=True)
@@ -0,0 +1,58 @@
+"""
+Backfill decision tags
+
+Populates the decision_tags lookup table from the JSON tags column, so tag
+filters and the tag list cover decisions created before tags were
+normalized. Tags that are already indexed are skipped, so re-running is safe.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-15
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+
+    if dialect == "sqlite":
+        op.execute(
+            "INSERT OR IGNORE INTO decision_tags (decision_id, tag) "
+            "SELECT DISTINCT d.id, t.value FROM decisions d, json_each(d.tags) t "
+            "WHERE json_type(d.tags) = 'array'"
+        )
+    elif dialect == "postgresql":
+        op.execute(
+            "INSERT INTO decision_tags (decision_id, tag) "
+            "SELECT DISTINCT d.id, t.tag FROM decisions d CROSS JOIN LATERAL "
+            "json_array_elements_text("
+            "CASE WHEN json_typeof(d.tags) = 'array' THEN d.tags ELSE '[]'::json END"
+            ") AS t(tag) "
+            "ON CONFLICT DO NOTHING"
+        )
+    else:
+        bind = op.get_bind()
+        decisions = sa.table("decisions", sa.column("id", sa.Integer), sa.column("tags", sa.JSON))
+        decision_tags = sa.table("decision_tags", sa.column("decision_id", sa.Integer), sa.column("tag", sa.String))
+
+        existing = set(bind.execute(sa.select(decision_tags.c.decision_id, decision_tags.c.tag)))
+        rows = [
+            {"decision_id": decision_id, "tag": tag}
+            for decision_id, tags in bind.execute(sa.select(decisions.c.id, decisions.c.tags))
+            if isinstance(tags, list)
+            for tag in dict.fromkeys(tags)
+            if (decision_id, tag) not in existing
+        ]
+        if rows:
+            op.bulk_insert(decision_tags, rows)
+
+
+def downgrade():
+    # decision_tags is a derived index of decisions.tags; nothing to undo
+    pass
@@ -14,17 +14,27 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from app.database import engine
+from app.models import DecisionSource
 from sqlalchemy import text
 
 
+def _create_indexes(conn, indexes):
+    """Execute each CREATE INDEX statement, reporting failures without stopping"""
+    for idx_sql in indexes:
+        try:
+            conn.execute(text(idx_sql))
+            index_name = idx_sql.split("idx_")[1].split(" ")[0] if "idx_" in idx_sql else "unknown"
+            print(f"  ✓ Created index: idx_{index_name}")
+        except Exception as e:
+            print(f"  ⚠ Index may already exist or error occurred: {str(e)[:100]}")
+
+
 def add_indexes():
     """Create performance indexes on key columns"""
     
     indexes = [
         # Decision table indexes
-        "CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions(timestamp DESC)",
         "CREATE INDEX IF NOT EXISTS idx_decisions_source ON decisions(source)",
-        "CREATE INDEX IF NOT EXISTS idx_decisions_confidence ON decisions(confidence)",
         "CREATE INDEX IF NOT EXISTS idx_decisions_decision_id ON decisions(decision_id)",
         
         # Decision steps indexes
@@ -37,23 +47,47 @@ def add_indexes():
         "CREATE INDEX IF NOT EXISTS idx_decisions_timestamp_source ON decisions(timestamp DESC, source)",
     ]
     
+    # PostgreSQL only: a compact BRIN index for time-range scans over the
+    # append-mostly log, and partial indexes for the hot narrow filters (the
+    # review queue and the per-source timeline); sources are stored by enum name
+    postgres_indexes = [
+        "CREATE INDEX IF NOT EXISTS idx_decisions_timestamp_brin ON decisions "
+        "USING BRIN (timestamp)",
+        "CREATE INDEX IF NOT EXISTS idx_decisions_low_conf ON decisions(timestamp DESC) "
+        "WHERE confidence < 0.7",
+    ] + [
+        f"CREATE INDEX IF NOT EXISTS idx_decisions_{source.value} ON decisions(timestamp DESC) "
+        f"WHERE source = '{source.name}'"
+        for source in DecisionSource
+    ]
+    
     print("🔧 Adding performance indexes to database...")
     
-    with engine.connect() as conn:
-        for idx_sql in indexes:
-            try:
-                conn.execute(text(idx_sql))
-                index_name = idx_sql.split("idx_")[1].split(" ")[0] if "idx_" in idx_sql else "unknown"
-                print(f"  ✓ Created index: idx_{index_name}")
-            except Exception as e:
-                print(f"  ⚠ Index may already exist or error occurred: {str(e)[:100]}")
-        
-        conn.commit()
+    if engine.dialect.name == "postgresql":
+        # Build without blocking writes; CONCURRENTLY cannot run inside a transaction
+        indexes = [
+            idx_sql.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY", 1)
+            for idx_sql in indexes + postgres_indexes
+        ]
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            _create_indexes(conn, indexes)
+            
+            # Refresh planner statistics for the new indexes
+            conn.execute(text("ANALYZE decisions"))
+            conn.execute(text("ANALYZE decision_steps"))
+            print("  ✓ Analyzed decisions and decision_steps")
+    else:
+        # Btree for time-range scans where BRIN is unavailable
+        indexes = [
+            "CREATE INDEX IF NOT EXISTS idx_decisions_timestamp ON decisions(timestamp DESC)",
+        ] + indexes
+        with engine.connect() as conn:
+            _create_indexes(conn, indexes)
+            conn.commit()
     
     print("\n✅ Database indexes created successfully!")
     print("📊 Query performance should now be significantly improved.")
     print("\nRecommended next steps:")
-    print("  - Run ANALYZE on your database (if using PostgreSQL)")
     print("  - Monitor query performance with EXPLAIN ANALYZE")
     print("  - Consider adding more indexes based on actual usage patterns")
 
@@ -9,94 +9,210 @@ import os
 from pathlib import Path
 
 # Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
 
+from alembic import command
+from alembic.config import Config
 from datetime import datetime, timedelta
-from app.database import SessionLocal, engine, Base
-from app.models import Decision, DecisionStep, DecisionSource, StepType
+from sqlalchemy import insert
+import csv
+import io
+import json
+from app.database import SessionLocal
+from app.models import Decision, DecisionStep, DecisionTag, DecisionSource, StepType
 import uuid
 import random
 
+# Per-step timestamp offsets for each scenario's step spacing (orders 0-7)
+STEP_OFFSETS_1S = tuple(timedelta(seconds=i) for i in range(8))
+STEP_OFFSETS_2S = tuple(timedelta(seconds=2 * i) for i in range(8))
+STEP_OFFSETS_3S = tuple(timedelta(seconds=3 * i) for i in range(8))
+STEP_OFFSETS_500MS = tuple(timedelta(milliseconds=500 * i) for i in range(8))
+
+
+def upgrade_schema():
+    """Run the Alembic migrations up to head (same as `alembic upgrade head`)"""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "migrations"))
+    command.upgrade(config, "head")
+
 
 def create_demo_decisions():
     """Create realistic demo decision scenarios"""
     
-    # Create tables
-    Base.metadata.create_all(bind=engine)
-    
-    db = SessionLocal()
-    
-    # Clear existing data
-    db.query(DecisionStep).delete()
-    db.query(Decision).delete()
-    db.commit()
+    # Create or upgrade the schema, including the search index
+    upgrade_schema()
     
     print("Loading demo data...")
     
-    # Scenario 1: Approved refund request
-    create_refund_approval(db, minutes_ago=10)
-    
-    # Scenario 2: Rejected refund (over limit)
-    create_refund_rejection(db, minutes_ago=25)
+    # Build every scenario in memory, then insert them all in bulk; all
+    # timestamps are relative to a single reference time
+    now = datetime.utcnow()
+    messages = []
+    pending = [
+        build_scenario(spec, now, spec["minutes_ago"], messages)
+        for spec in SCENARIOS
+    ]
     
-    # Scenario 3: Support ticket escalation
-    create_support_escalation(db, minutes_ago=45)
+    # Add some older decisions for timeline variety (3 hours to 2 days ago)
+    picks = random.choices((REFUND_APPROVAL, SUPPORT_ESCALATION), k=10)
+    minutes = random.choices(range(180, 2881), k=10)
+    pending += [
+        build_scenario(spec, now, minutes_ago)
+        for spec, minutes_ago in zip(picks, minutes)
+    ]
     
-    # Scenario 4: Low confidence - manual review
-    create_manual_review(db, minutes_ago=60)
+    db = SessionLocal()
     
-    # Scenario 5: Automated content moderation
-    create_content_moderation(db, minutes_ago=90)
+    try:
+        # Clear and reload in a single transaction, committed once on exit
+        with db.begin():
+            db.query(DecisionTag).delete()
+            db.query(DecisionStep).delete()
+            db.query(Decision).delete()
+            
+            insert_decisions(db, pending)
+    finally:
+        db.close()
+    
+    # Report everything in one write once the load has committed
+    messages += [
+        "Demo data loaded successfully!",
+        f"Created {len(pending)} decision records",
+        "\nStart the backend and visit http://localhost:8000/docs to explore the API",
+    ]
+    sys.stdout.write("\n".join(messages) + "\n")
+
+
+def step_rows(base_time, steps, offsets=STEP_OFFSETS_1S):
+    """Expand (order, type, content, metadata) tuples into step rows"""
+    return [
+        {
+            "step_order": order,
+            "step_type": step_type,
+            "content": content,
+            "step_metadata": metadata,
+            "timestamp": base_time + offsets[order]
+        }
+        for order, step_type, content, metadata in steps
+    ]
+
+
+def insert_decisions(db, pending):
+    """
+    Insert staged (decision, steps) pairs with one bulk statement per table
+    
+    Decision IDs come back from a single INSERT ... RETURNING in parameter
+    order, so no per-decision flush is needed to link steps and tags.
+    """
+    ids = db.scalars(
+        insert(Decision).returning(Decision.id, sort_by_parameter_order=True),
+        # executemany needs uniform keys; only some scenarios set outcome_data
+        [{"outcome_data": None, **decision} for decision, _ in pending]
+    ).all()
+    
+    all_step_rows = [
+        {"decision_id": decision_id, **step}
+        for decision_id, (_, steps) in zip(ids, pending)
+        for step in steps
+    ]
+    # copy_expert is psycopg2's API; other Postgres drivers use executemany
+    if db.bind.dialect.name == "postgresql" and db.bind.dialect.driver == "psycopg2":
+        copy_step_rows(db, all_step_rows)
+    else:
+        db.execute(insert(DecisionStep), all_step_rows)
+    
+    tag_rows = [
+        {"decision_id": decision_id, "tag": tag}
+        for decision_id, (decision, _) in zip(ids, pending)
+        for tag in dict.fromkeys(decision["tags"] or [])
+    ]
+    if tag_rows:
+        db.execute(insert(DecisionTag), tag_rows)
+
+
+def copy_step_rows(db, rows):
+    """
+    Stream step rows into decision_steps with COPY (PostgreSQL via psycopg2 only)
+    
+    Uses the session's own DBAPI connection, so the COPY is part of the
+    surrounding load transaction.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow((
+            row["decision_id"],
+            row["step_order"],
+            row["step_type"].name,  # Enum columns store member names
+            row["content"],
+            json.dumps(row["step_metadata"]),
+            row["timestamp"].isoformat()
+        ))
+    buf.seek(0)
+    
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY decision_steps (decision_id, step_order, step_type, content, "
+            "step_metadata, timestamp) FROM STDIN WITH (FORMAT csv)",
+            buf
+        )
+    finally:
+        cursor.close()
+
+
+def build_scenario(spec, now, minutes_ago=0, messages=None):
+    """
+    Stamp a scenario spec into (decision, steps) rows relative to now
     
-    # Scenario 6: Loan approval (hybrid decision)
-    create_loan_approval(db, minutes_ago=120)
+    A progress line is appended to messages when a list is given.
+    """
+    base_time = now - timedelta(minutes=minutes_ago)
     
-    # Add some older decisions for timeline variety
-    for i in range(10):
-        minutes = random.randint(180, 2880)  # 3 hours to 2 days ago
-        if random.random() > 0.5:
-            create_refund_approval(db, minutes_ago=minutes, silent=True)
-        else:
-            create_support_escalation(db, minutes_ago=minutes, silent=True)
+    decision = {
+        "decision_id": f"dec_{uuid.uuid4().hex[:12]}",
+        "timestamp": base_time,
+        **spec["decision"]
+    }
+    steps = step_rows(base_time, spec["steps"], spec["step_offsets"])
     
-    db.close()
+    if messages is not None:
+        messages.append(f"{spec['label']} ({decision['decision_id']})")
     
-    print("Demo data loaded successfully!")
-    print(f"Created {6 + 10} decision records")
-    print("\nStart the backend and visit http://localhost:8000/docs to explore the API")
+    return decision, steps
 
 
-def create_refund_approval(db, minutes_ago=0, silent=False):
-    """Premium customer refund - auto-approved"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Demo scenarios. Each spec is static data shared by every decision built
+# from it; build_scenario only adds the per-decision ID and timestamps.
+
+# Premium customer refund - auto-approved
+REFUND_APPROVAL = {
+    "label": "[APPROVED] Created: Refund approval",
+    "minutes_ago": 10,
+    "step_offsets": STEP_OFFSETS_1S,
+    "decision": {
+        "input_data": {
             "request_type": "refund",
             "user_id": "user_12345",
             "amount": 79.99,
             "reason": "Product not as described"
         },
-        system_state={
+        "system_state": {
             "user_tier": "premium",
             "account_age_days": 456,
             "previous_refunds": 1,
             "total_spend": 2450.00
         },
-        reasoning="User is premium tier with excellent history. Amount $79.99 is within auto-approval limit of $100. Previous refund count (1) is acceptable.",
-        decision="approve_refund",
-        confidence=0.95,
-        source=DecisionSource.RULE,
-        outcome="Refund processed successfully",
-        tags=["refund", "auto_approved", "low_value"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "reasoning": "User is premium tier with excellent history. Amount $79.99 is within auto-approval limit of $100. Previous refund count (1) is acceptable.",
+        "decision": "approve_refund",
+        "confidence": 0.95,
+        "source": DecisionSource.RULE,
+        "outcome": "Refund processed successfully",
+        "tags": ("refund", "auto_approved", "low_value"),
+    },
+    "steps": (
         (0, StepType.INPUT, "Refund request received: $79.99 for order #ORD-8821", 
          {"order_id": "ORD-8821"}),
         (1, StepType.REASONING, "Checking user tier and account status...", 
@@ -108,57 +224,36 @@ def create_refund_approval(db, minutes_ago=0, silent=False):
         (4, StepType.ACTION, "Processing refund to original payment method",
          {"payment_method": "Visa ending in 1234"}),
         (5, StepType.OUTCOME, "Refund processed successfully. Transaction ID: TXN-REF-9821",
-         {"transaction_id": "TXN-REF-9821", "processing_time_ms": 234})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(seconds=order)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    if not silent:
-        print(f"[APPROVED] Created: Refund approval ({decision.decision_id})")
-
+         {"transaction_id": "TXN-REF-9821", "processing_time_ms": 234}),
+    ),
+}
 
-def create_refund_rejection(db, minutes_ago=0):
-    """Non-premium customer over limit - rejected"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Non-premium customer over limit - rejected
+REFUND_REJECTION = {
+    "label": "[REJECTED] Created: Refund rejection",
+    "minutes_ago": 25,
+    "step_offsets": STEP_OFFSETS_2S,
+    "decision": {
+        "input_data": {
             "request_type": "refund",
             "user_id": "user_67890",
             "amount": 249.99,
             "reason": "Changed my mind"
         },
-        system_state={
+        "system_state": {
             "user_tier": "standard",
             "account_age_days": 45,
             "previous_refunds": 3,
             "total_spend": 310.00
         },
-        reasoning="User is standard tier with high refund rate (3 previous refunds). Amount $249.99 exceeds auto-approval limit for standard users ($50). Account age is only 45 days.",
-        decision="reject_refund_auto_review",
-        confidence=0.88,
-        source=DecisionSource.RULE,
-        outcome="Refund rejected - sent to manual review queue",
-        tags=["refund", "rejected", "high_value"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "reasoning": "User is standard tier with high refund rate (3 previous refunds). Amount $249.99 exceeds auto-approval limit for standard users ($50). Account age is only 45 days.",
+        "decision": "reject_refund_auto_review",
+        "confidence": 0.88,
+        "source": DecisionSource.RULE,
+        "outcome": "Refund rejected - sent to manual review queue",
+        "tags": ("refund", "rejected", "high_value"),
+    },
+    "steps": (
         (0, StepType.INPUT, "Refund request received: $249.99 for order #ORD-3341",
          {"order_id": "ORD-3341"}),
         (1, StepType.REASONING, "Checking user tier and refund history...",
@@ -170,55 +265,35 @@ def create_refund_rejection(db, minutes_ago=0):
         (4, StepType.ACTION, "Adding to manual review queue with priority: normal",
          {"queue": "refund_review", "priority": "normal"}),
         (5, StepType.OUTCOME, "Request queued for human review. Estimated review time: 24-48 hours",
-         {"queue_position": 12})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(seconds=order * 2)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    print(f"[REJECTED] Created: Refund rejection ({decision.decision_id})")
-
+         {"queue_position": 12}),
+    ),
+}
 
-def create_support_escalation(db, minutes_ago=0, silent=False):
-    """Support ticket with legal keywords - escalated"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Support ticket with legal keywords - escalated
+SUPPORT_ESCALATION = {
+    "label": "[ESCALATED] Created: Support escalation",
+    "minutes_ago": 45,
+    "step_offsets": STEP_OFFSETS_1S,
+    "decision": {
+        "input_data": {
             "request_type": "support_ticket",
             "user_id": "user_44321",
             "message": "I need to speak with your legal department about privacy concerns",
             "category": "account_issue"
         },
-        system_state={
+        "system_state": {
             "user_tier": "premium",
             "account_status": "active",
             "previous_tickets": 2
         },
-        reasoning="Message contains sensitive keyword 'legal' requiring immediate human escalation per compliance policy.",
-        decision="escalate_to_human_urgent",
-        confidence=0.98,
-        source=DecisionSource.RULE,
-        outcome="Escalated to senior support agent",
-        tags=["support", "escalated", "legal", "urgent"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "reasoning": "Message contains sensitive keyword 'legal' requiring immediate human escalation per compliance policy.",
+        "decision": "escalate_to_human_urgent",
+        "confidence": 0.98,
+        "source": DecisionSource.RULE,
+        "outcome": "Escalated to senior support agent",
+        "tags": ("support", "escalated", "legal", "urgent"),
+    },
+    "steps": (
         (0, StepType.INPUT, "Support ticket received: Category=account_issue",
          {"ticket_id": "TKT-9921"}),
         (1, StepType.REASONING, "Analyzing message content for keywords and sentiment...",
@@ -230,55 +305,34 @@ def create_support_escalation(db, minutes_ago=0, silent=False):
         (4, StepType.ACTION, "Routing to senior support team",
          {"team": "senior_support", "agent_available": True}),
         (5, StepType.OUTCOME, "Ticket assigned to Agent Sarah Chen (available)",
-         {"agent_id": "agent_sarah_chen", "response_time_target": "15_minutes"})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(seconds=order)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    if not silent:
-        print(f"[ESCALATED] Created: Support escalation ({decision.decision_id})")
+         {"agent_id": "agent_sarah_chen", "response_time_target": "15_minutes"}),
+    ),
+}
 
-
-def create_manual_review(db, minutes_ago=0):
-    """Edge case requiring manual review"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Edge case requiring manual review
+MANUAL_REVIEW = {
+    "label": "[MANUAL REVIEW] Created: Manual review",
+    "minutes_ago": 60,
+    "step_offsets": STEP_OFFSETS_3S,
+    "decision": {
+        "input_data": {
             "request_type": "account_closure",
             "user_id": "user_99887",
             "reason": "Moving to competitor"
         },
-        system_state={
+        "system_state": {
             "user_tier": "enterprise",
             "contract_value": 50000.00,
             "contract_end_date": "2026-06-30"
         },
-        reasoning="Enterprise account with active contract. No automatic decision rule exists for mid-contract cancellations. Requires human negotiation.",
-        decision="manual_review_required",
-        confidence=0.50,
-        source=DecisionSource.MANUAL,
-        outcome="Pending manual review",
-        tags=["account_management", "enterprise", "manual_review"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "reasoning": "Enterprise account with active contract. No automatic decision rule exists for mid-contract cancellations. Requires human negotiation.",
+        "decision": "manual_review_required",
+        "confidence": 0.50,
+        "source": DecisionSource.MANUAL,
+        "outcome": "Pending manual review",
+        "tags": ("account_management", "enterprise", "manual_review"),
+    },
+    "steps": (
         (0, StepType.INPUT, "Account closure request: Enterprise account (Contract value: $50,000)",
          {"contract_id": "CNT-2024-E-0892"}),
         (1, StepType.REASONING, "Checking account status and contract terms...",
@@ -290,54 +344,34 @@ def create_manual_review(db, minutes_ago=0):
         (4, StepType.ACTION, "Assigning to account management team",
          {"team": "enterprise_accounts", "priority": "high"}),
         (5, StepType.OUTCOME, "Pending review by Account Manager",
-         {"assigned_to": "Jennifer Park", "follow_up_required": True})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(seconds=order * 3)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    print(f"[MANUAL REVIEW] Created: Manual review ({decision.decision_id})")
-
+         {"assigned_to": "Jennifer Park", "follow_up_required": True}),
+    ),
+}
 
-def create_content_moderation(db, minutes_ago=0):
-    """Automated content moderation"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Automated content moderation
+CONTENT_MODERATION = {
+    "label": "[FLAGGED] Created: Content moderation",
+    "minutes_ago": 90,
+    "step_offsets": STEP_OFFSETS_500MS,
+    "decision": {
+        "input_data": {
             "content_type": "user_comment",
             "content_id": "cmt_445566",
             "text": "Check out this amazing deal at example-spam-site.com/offer"
         },
-        system_state={
+        "system_state": {
             "user_reputation": 45,
             "account_age_days": 2,
             "previous_violations": 0
         },
-        reasoning="LLM detected promotional content with external link. New account with low reputation score. Content classified as spam with 89% confidence.",
-        decision="remove_content",
-        confidence=0.89,
-        source=DecisionSource.HYBRID,
-        outcome="Content removed and user notified",
-        tags=["moderation", "spam", "automated"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "reasoning": "LLM detected promotional content with external link. New account with low reputation score. Content classified as spam with 89% confidence.",
+        "decision": "remove_content",
+        "confidence": 0.89,
+        "source": DecisionSource.HYBRID,
+        "outcome": "Content removed and user notified",
+        "tags": ("moderation", "spam", "automated"),
+    },
+    "steps": (
         (0, StepType.INPUT, "New comment posted by user_77123",
          {"content_id": "cmt_445566", "length": 67}),
         (1, StepType.REASONING, "Running content analysis (LLM + rules)...",
@@ -349,61 +383,41 @@ def create_content_moderation(db, minutes_ago=0):
         (4, StepType.ACTION, "Removing content and sending notification to user",
          {"notification_sent": True, "appeal_available": True}),
         (5, StepType.OUTCOME, "Content removed. User can appeal within 7 days.",
-         {"appeal_deadline": "2026-01-27", "strike_count": 1})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(milliseconds=order * 500)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    print(f"[FLAGGED] Created: Content moderation ({decision.decision_id})")
+         {"appeal_deadline": "2026-01-27", "strike_count": 1}),
+    ),
+}
 
-
-def create_loan_approval(db, minutes_ago=0):
-    """Loan approval using hybrid decision"""
-    base_time = datetime.utcnow() - timedelta(minutes=minutes_ago)
-    
-    decision = Decision(
-        decision_id=f"dec_{uuid.uuid4().hex[:12]}",
-        timestamp=base_time,
-        input_data={
+# Loan approval using hybrid decision
+LOAN_APPROVAL = {
+    "label": "[LOAN APPROVED] Created: Loan approval",
+    "minutes_ago": 120,
+    "step_offsets": STEP_OFFSETS_2S,
+    "decision": {
+        "input_data": {
             "request_type": "personal_loan",
             "amount": 15000.00,
             "term_months": 36,
             "applicant_id": "app_33221"
         },
-        system_state={
+        "system_state": {
             "credit_score": 720,
             "income_annual": 65000.00,
             "debt_to_income": 0.28,
             "employment_years": 4
         },
-        reasoning="Credit score (720) exceeds minimum threshold (680). Debt-to-income ratio (28%) is healthy. Stable employment (4 years). LLM analysis of application documents shows consistent income history. Risk assessment: Low.",
-        decision="approve_loan",
-        confidence=0.91,
-        source=DecisionSource.HYBRID,
-        outcome="Loan approved with interest rate 6.5%",
-        outcome_data={
+        "reasoning": "Credit score (720) exceeds minimum threshold (680). Debt-to-income ratio (28%) is healthy. Stable employment (4 years). LLM analysis of application documents shows consistent income history. Risk assessment: Low.",
+        "decision": "approve_loan",
+        "confidence": 0.91,
+        "source": DecisionSource.HYBRID,
+        "outcome": "Loan approved with interest rate 6.5%",
+        "outcome_data": {
             "interest_rate": 0.065,
             "monthly_payment": 458.72,
             "total_repayment": 16514.00
         },
-        tags=["loan", "approved", "personal_loan"]
-    )
-    
-    db.add(decision)
-    db.flush()
-    
-    steps = [
+        "tags": ("loan", "approved", "personal_loan"),
+    },
+    "steps": (
         (0, StepType.INPUT, "Loan application received: $15,000 for 36 months",
          {"application_id": "LN-2026-00892"}),
         (1, StepType.REASONING, "Performing credit check and income verification...",
@@ -419,23 +433,19 @@ def create_loan_approval(db, minutes_ago=0):
         (6, StepType.ACTION, "Generating loan agreement and notification",
          {"agreement_id": "AGR-2026-00892"}),
         (7, StepType.OUTCOME, "Loan approved. Funds available in 2-3 business days.",
-         {"disbursement_method": "direct_deposit", "estimated_date": "2026-01-23"})
-    ]
-    
-    for order, step_type, content, metadata in steps:
-        step = DecisionStep(
-            decision_id=decision.id,
-            step_order=order,
-            step_type=step_type,
-            content=content,
-            metadata=metadata,
-            timestamp=base_time + timedelta(seconds=order * 2)
-        )
-        db.add(step)
-    
-    db.commit()
-    
-    print(f"[LOAN APPROVED] Created: Loan approval ({decision.decision_id})")
+         {"disbursement_method": "direct_deposit", "estimated_date": "2026-01-23"}),
+    ),
+}
+
+
+SCENARIOS = (
+    REFUND_APPROVAL,
+    REFUND_REJECTION,
+    SUPPORT_ESCALATION,
+    MANUAL_REVIEW,
+    CONTENT_MODERATION,
+    LOAN_APPROVAL,
+)
 
 
 if __name__ == "__main__":
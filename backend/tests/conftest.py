@@ -0,0 +1,78 @@
+"""
+Shared test database fixtures
+
+Tests run against one in-memory SQLite connection. Each test gets a session
+inside an outer transaction that is rolled back at teardown; commits made by
+the API only release a SAVEPOINT, and the response caches are cleared, so
+nothing outlives the test.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.cache import invalidate_caches
+from app.main import app
+from app.database import Base, get_db, json_serializer
+
+# Test database: a single in-memory connection shared by every session
+TEST_DATABASE_URL = "sqlite://"
+test_engine = create_engine(
+    TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+    json_serializer=json_serializer
+)
+
+
+@event.listens_for(test_engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Skip fsyncs and keep the journal in memory; test data is throwaway"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA journal_mode=MEMORY")
+    cursor.close()
+    # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs nest correctly
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine, "begin")
+def _begin_sqlite_transaction(connection):
+    connection.exec_driver_sql("BEGIN")
+
+
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Test engine with the schema created once per test run"""
+    Base.metadata.create_all(bind=test_engine)
+    yield test_engine
+    Base.metadata.drop_all(bind=test_engine)
+
+
+@pytest.fixture(scope="session")
+def client(db_engine):
+    """One TestClient shared by every API test"""
+    return TestClient(app)
+
+
+@pytest.fixture
+def db(db_engine):
+    """Session bound to a rolled-back transaction, used by the API as get_db"""
+    connection = db_engine.connect()
+    trans = connection.begin()
+    session = TestSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        yield session
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        session.close()
+        trans.rollback()
+        connection.close()
+        # Cached tags/stats would otherwise outlive the rolled-back rows
+        invalidate_caches()
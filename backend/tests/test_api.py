@@ -4,39 +4,48 @@ Unit tests for decision API endpoints
 Run with: pytest backend/tests/test_api.py -v
 """
 import pytest
-from fastapi.testclient import TestClient
-from datetime import datetime
+import csv
+from datetime import datetime, timedelta
+import io
+import json
+from types import SimpleNamespace
+import uuid
 
-from app.main import app
-from app.database import Base, engine, get_db
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from app.cache import invalidate_caches
+from app.models import Decision as DecisionModel, DecisionSource, DecisionTag
+from app.routers.stats import _daily_series
+from sqlalchemy import insert
 
-# Test database
-TEST_DATABASE_URL = "sqlite:///./test_decisions.db"
-test_engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+pytestmark = pytest.mark.usefixtures("db")
 
-Base.metadata.create_all(bind=test_engine)
 
-
-def override_get_db():
-    try:
-        db = TestSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-app.dependency_overrides[get_db] = override_get_db
-
-client = TestClient(app)
+@pytest.fixture
+def seed_decisions(db):
+    """Insert decision rows directly in one round-trip, returning their decision_ids"""
+    def seed(rows):
+        rows = [
+            {
+                "decision_id": f"dec_{uuid.uuid4().hex[:12]}",
+                "input_data": {},
+                "reasoning": "",
+                "source": DecisionSource.RULE,
+                **row,
+            }
+            for row in rows
+        ]
+        decision_ids = db.execute(
+            insert(DecisionModel).returning(DecisionModel.decision_id), rows
+        ).scalars().all()
+        db.commit()
+        invalidate_caches()
+        return decision_ids
+    return seed
 
 
 class TestDecisionAPI:
     """Test suite for decision endpoints"""
     
-    def test_create_decision(self):
+    def test_create_decision(self, client):
         """Test creating a new decision"""
         response = client.post("/api/decisions", json={
             "input_data": {"user_id": "test_123", "amount": 99.99},
@@ -57,7 +66,26 @@ class TestDecisionAPI:
         assert "decision_id" in data
         assert data["decision_id"].startswith("dec_")
     
-    def test_create_decision_with_invalid_confidence(self):
+    def test_create_decisions_batch(self, client):
+        """Test creating several decisions in one request"""
+        response = client.post("/api/decisions/batch", json=[
+            {
+                "input_data": {"batch_index": i},
+                "reasoning": f"Batch reasoning {i}",
+                "decision": f"batch_{i}",
+                "confidence": 0.8,
+                "source": "llm"
+            }
+            for i in range(3)
+        ])
+        
+        assert response.status_code == 201
+        data = response.json()
+        assert [d["decision"] for d in data] == ["batch_0", "batch_1", "batch_2"]
+        assert len({d["decision_id"] for d in data}) == 3
+        assert all(d["steps"] for d in data)
+    
+    def test_create_decision_with_invalid_confidence(self, client):
         """Test validation for confidence values"""
         response = client.post("/api/decisions", json={
             "input_data": {},
@@ -68,7 +96,7 @@ class TestDecisionAPI:
         
         assert response.status_code == 422  # Validation error
     
-    def test_get_decisions_with_filters(self):
+    def test_get_decisions_with_filters(self, client):
         """Test retrieving decisions with filters"""
         # First create a decision
         client.post("/api/decisions", json={
@@ -86,16 +114,13 @@ class TestDecisionAPI:
         assert "total" in data
         assert isinstance(data["decisions"], list)
     
-    def test_get_decisions_pagination(self):
+    def test_get_decisions_pagination(self, client, seed_decisions):
         """Test pagination"""
         # Create multiple decisions
-        for i in range(5):
-            client.post("/api/decisions", json={
-                "input_data": {},
-                "decision": f"test_{i}",
-                "confidence": 0.8,
-                "source": "rule"
-            })
+        seed_decisions([
+            {"decision": f"test_{i}", "confidence": 0.8}
+            for i in range(5)
+        ])
         
         # Test limit
         response = client.get("/api/decisions?limit=3")
@@ -109,7 +134,25 @@ class TestDecisionAPI:
         data = response.json()
         assert data["offset"] == 2
     
-    def test_get_decision_by_id(self):
+    def test_get_decisions_offset_past_end(self, client, seed_decisions):
+        """Test the total is still reported when the page is past the last match"""
+        seed_decisions([
+            {"decision": f"test_{i}", "confidence": 0.8, "source": source}
+            for i, source in enumerate([DecisionSource.RULE] * 3 + [DecisionSource.LLM] * 2)
+        ])
+        
+        for offset in (5, 50):
+            data = client.get(f"/api/decisions?offset={offset}&limit=10").json()
+            assert data["decisions"] == []
+            assert data["total"] == 5
+            assert data["has_more"] is False
+        
+        # The fallback count applies the same filters as the page query
+        data = client.get("/api/decisions?source=rule&offset=3").json()
+        assert data["decisions"] == []
+        assert data["total"] == 3
+    
+    def test_get_decision_by_id(self, client):
         """Test retrieving specific decision"""
         # Create decision
         create_response = client.post("/api/decisions", json={
@@ -135,21 +178,103 @@ class TestDecisionAPI:
         assert data["decision_id"] == decision_id
         assert data["decision"] == "test_decision"
     
-    def test_get_nonexistent_decision(self):
+    def test_get_nonexistent_decision(self, client):
         """Test 404 for nonexistent decision"""
         response = client.get("/api/decisions/nonexistent_id")
         assert response.status_code == 404
     
-    def test_search_decisions(self):
+    def test_decision_with_integer_beyond_64_bits(self, client):
+        """Test payloads orjson cannot encode still round-trip"""
+        big = 123456789012345678901234567890
+        create_response = client.post("/api/decisions", json={
+            "input_data": {"order": big},
+            "reasoning": "Large order number",
+            "decision": "approve",
+            "confidence": 0.9,
+            "source": "rule"
+        })
+        assert create_response.status_code == 201
+        assert create_response.json()["input_data"]["order"] == big
+        decision_id = create_response.json()["decision_id"]
+        
+        response = client.get(f"/api/decisions/{decision_id}")
+        assert response.status_code == 200
+        assert response.json()["input_data"]["order"] == big
+        
+        response = client.get(f"/api/decisions/{decision_id}/replay")
+        assert response.status_code == 200
+        assert response.json()["decision"]["input_data"]["order"] == big
+        
+        response = client.get("/api/decisions/export/json")
+        assert response.status_code == 200
+        assert json.loads(response.text.splitlines()[1])["input_data"]["order"] == big
+        
+        response = client.get("/api/decisions/export/json?pretty=true")
+        assert response.status_code == 200
+        assert response.json()["decisions"][0]["input_data"]["order"] == big
+    
+    def test_create_decision_with_nan_payload(self, client):
+        """Test NaN is rejected rather than silently stored as null"""
+        response = client.post("/api/decisions", json={
+            "input_data": {"score": float("nan")},
+            "reasoning": "Test reasoning",
+            "decision": "test",
+            "confidence": 0.8,
+            "source": "rule"
+        })
+        
+        assert response.status_code == 422  # Validation error
+    
+    def test_create_decision_with_nan_step_metadata(self, client):
+        """Test NaN in explicit step metadata is rejected too"""
+        response = client.post("/api/decisions", json={
+            "input_data": {},
+            "reasoning": "Test reasoning",
+            "decision": "test",
+            "confidence": 0.8,
+            "source": "rule",
+            "steps": [{
+                "step_type": "input",
+                "content": "Input received",
+                "step_metadata": {"score": float("inf")}
+            }]
+        })
+        
+        assert response.status_code == 422  # Validation error
+    
+    def test_writes_invalidate_cached_tags_and_stats(self, client):
+        """Test create and delete clear the cached tag list and stats"""
+        # Prime both caches
+        total = client.get("/api/stats/overview?days=7").json()["total_decisions"]
+        assert "cache_probe" not in client.get("/api/traces/tags").json()["tags"]
+        
+        create_response = client.post("/api/decisions", json={
+            "input_data": {},
+            "reasoning": "Test reasoning",
+            "decision": "test",
+            "confidence": 0.8,
+            "source": "rule",
+            "tags": ["cache_probe"]
+        })
+        decision_id = create_response.json()["decision_id"]
+        
+        assert "cache_probe" in client.get("/api/traces/tags").json()["tags"]
+        assert client.get("/api/stats/overview?days=7").json()["total_decisions"] == total + 1
+        
+        response = client.delete(f"/api/decisions/{decision_id}")
+        assert response.status_code == 204
+        
+        assert "cache_probe" not in client.get("/api/traces/tags").json()["tags"]
+        assert client.get("/api/stats/overview?days=7").json()["total_decisions"] == total
+    
+    def test_search_decisions(self, client, seed_decisions):
         """Test search functionality"""
         # Create decision with searchable content
-        client.post("/api/decisions", json={
-            "input_data": {},
+        seed_decisions([{
             "reasoning": "This is unique searchable content",
             "decision": "test",
             "confidence": 0.8,
-            "source": "rule"
-        })
+        }])
         
         # Search
         response = client.get("/api/decisions?search=searchable")
@@ -158,10 +283,80 @@ class TestDecisionAPI:
         assert data["total"] > 0
 
 
+class TestTagAPI:
+    """Test suite for tag filtering and the tag list"""
+    
+    def create_tagged(self, client, *tag_lists):
+        response = client.post("/api/decisions/batch", json=[
+            {
+                "input_data": {},
+                "reasoning": "Tagged decision",
+                "decision": f"tagged_{i}",
+                "confidence": 0.8,
+                "source": "rule",
+                "tags": tags
+            }
+            for i, tags in enumerate(tag_lists)
+        ])
+        assert response.status_code == 201
+        return [d["decision_id"] for d in response.json()]
+    
+    def test_filter_by_tag(self, client):
+        """Test the tag filter matches only decisions carrying the tag"""
+        alpha_id, beta_id = self.create_tagged(client, ["alpha", "shared"], ["beta", "shared"])
+        
+        data = client.get("/api/decisions?tag=alpha").json()
+        assert [d["decision_id"] for d in data["decisions"]] == [alpha_id]
+        assert data["total"] == 1
+        
+        data = client.get("/api/decisions?tag=shared").json()
+        assert {d["decision_id"] for d in data["decisions"]} == {alpha_id, beta_id}
+        
+        assert client.get("/api/decisions?tag=missing").json()["total"] == 0
+    
+    def test_get_all_tags(self, client):
+        """Test the tag list is unique and sorted"""
+        self.create_tagged(client, ["beta", "alpha"], ["alpha", "alpha"])
+        
+        data = client.get("/api/traces/tags").json()
+        assert data["tags"] == ["alpha", "beta"]
+        assert data["total_unique_tags"] == 2
+    
+    def test_delete_removes_tags(self, client, db):
+        """Test deleting a decision removes its tag rows"""
+        decision_id, = self.create_tagged(client, ["doomed"])
+        
+        response = client.delete(f"/api/decisions/{decision_id}")
+        assert response.status_code == 204
+        
+        assert db.query(DecisionTag).filter(DecisionTag.tag == "doomed").count() == 0
+        assert client.get("/api/decisions?tag=doomed").json()["total"] == 0
+        assert "doomed" not in client.get("/api/traces/tags").json()["tags"]
+
+
 class TestStatsAPI:
     """Test suite for stats endpoints"""
     
-    def test_get_stats_overview(self):
+    @pytest.fixture
+    def seeded_days(self, seed_decisions):
+        """Seed decisions on known days; returns the last seven dates, oldest first"""
+        midnight = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        seed_decisions([
+            # Today: one high and one medium, both on the range boundaries
+            {"decision": "today_high", "confidence": 0.8, "source": DecisionSource.RULE,
+             "timestamp": midnight + timedelta(seconds=1)},
+            {"decision": "today_medium", "confidence": 0.5, "source": DecisionSource.LLM,
+             "timestamp": midnight + timedelta(seconds=2)},
+            # Two days ago: one low
+            {"decision": "older_low", "confidence": 0.3, "source": DecisionSource.HYBRID,
+             "timestamp": midnight - timedelta(days=2) + timedelta(hours=12)},
+            # Outside the 7-day window
+            {"decision": "oldest", "confidence": 0.95, "source": DecisionSource.MANUAL,
+             "timestamp": midnight - timedelta(days=10)},
+        ])
+        return [(midnight - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(6, -1, -1)]
+    
+    def test_get_stats_overview(self, client):
         """Test stats overview endpoint"""
         response = client.get("/api/stats/overview?days=7")
         assert response.status_code == 200
@@ -170,34 +365,133 @@ class TestStatsAPI:
         assert "average_confidence" in data
         assert "source_distribution" in data
     
-    def test_get_stats_timeline(self):
+    def test_stats_overview_aggregates(self, client, seeded_days):
+        """Test the overview totals, buckets and daily trend over seeded days"""
+        data = client.get("/api/stats/overview?days=7").json()
+        
+        assert data["total_decisions"] == 3
+        assert data["average_confidence"] == 0.533
+        assert data["lowest_confidence"] == 0.3
+        assert data["confidence_ranges"] == {"high": 1, "medium": 1, "low": 1}
+        assert data["source_distribution"] == {
+            "rule": {"count": 1, "percentage": 33.33},
+            "llm": {"count": 1, "percentage": 33.33},
+            "hybrid": {"count": 1, "percentage": 33.33},
+        }
+        assert data["daily_trend"] == [
+            {"date": date, "count": count}
+            for date, count in zip(seeded_days, [0, 0, 0, 0, 1, 0, 2])
+        ]
+        
+        data = client.get("/api/stats/overview?days=30").json()
+        assert data["total_decisions"] == 4
+        assert data["source_distribution"]["manual"] == {"count": 1, "percentage": 25.0}
+        assert data["confidence_ranges"] == {"high": 2, "medium": 1, "low": 1}
+    
+    def test_get_stats_timeline(self, client):
         """Test stats timeline endpoint"""
         response = client.get("/api/stats/timeline?days=7")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
         assert isinstance(data["data"], list)
+    
+    def test_stats_timeline_zero_fills_days(self, client, seeded_days):
+        """Test the timeline has one entry per day, with empty days zero-filled"""
+        data = client.get("/api/stats/timeline?days=7").json()
+        
+        assert data["data"] == [
+            {"date": date, "count": count, "average_confidence": avg}
+            for date, count, avg in zip(
+                seeded_days,
+                [0, 0, 0, 0, 1, 0, 2],
+                [0.0, 0.0, 0.0, 0.0, 0.3, 0.0, 0.65]
+            )
+        ]
+        
+        data = client.get("/api/stats/timeline?days=30").json()
+        assert len(data["data"]) == 30
+        assert sum(day["count"] for day in data["data"]) == 4
+    
+    def test_daily_series_rejects_unsupported_dialect(self):
+        """Test an unsupported database fails with a clear error"""
+        db = SimpleNamespace(bind=SimpleNamespace(dialect=SimpleNamespace(name="mysql")))
+        
+        with pytest.raises(NotImplementedError, match="'mysql'"):
+            _daily_series(db, datetime.utcnow(), 7)
 
 
 class TestExportAPI:
     """Test suite for export endpoints"""
     
-    def test_export_csv(self):
+    def create_exported(self, client):
+        response = client.post("/api/decisions/batch", json=[
+            {
+                "input_data": {"export_index": i},
+                "reasoning": f"Export reasoning {i}",
+                "decision": f"export_{i}",
+                "confidence": 0.8,
+                "source": "rule",
+                "outcome": "success"
+            }
+            for i in range(2)
+        ])
+        assert response.status_code == 201
+        return {d["decision_id"] for d in response.json()}
+    
+    def test_export_csv(self, client):
         """Test CSV export"""
+        decision_ids = self.create_exported(client)
+        
         response = client.get("/api/decisions/export/csv")
         assert response.status_code == 200
         assert response.headers["content-type"] == "text/csv; charset=utf-8"
         assert "attachment" in response.headers["content-disposition"]
+        
+        header, *rows = csv.reader(io.StringIO(response.text))
+        assert header[0] == "Decision ID"
+        assert decision_ids <= {row[0] for row in rows}
     
-    def test_export_json(self):
-        """Test JSON export"""
+    def test_export_json(self, client):
+        """Test JSON export (newline-delimited by default)"""
+        decision_ids = self.create_exported(client)
+        
         response = client.get("/api/decisions/export/json")
         assert response.status_code == 200
-        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-type"] == "application/x-ndjson"
         assert "attachment" in response.headers["content-disposition"]
+        
+        meta_line, *decision_lines = response.text.splitlines()
+        meta = json.loads(meta_line)["meta"]
+        assert meta["total_decisions"] == len(decision_lines)
+        
+        decisions = [json.loads(line) for line in decision_lines]
+        assert decision_ids <= {d["decision_id"] for d in decisions}
+        for decision in decisions:
+            step_orders = [s["step_order"] for s in decision["steps"]]
+            assert len(step_orders) > 1
+            assert step_orders == sorted(step_orders)
+    
+    def test_export_json_pretty(self, client):
+        """Test pretty JSON export holds the same decisions as the NDJSON export"""
+        decision_ids = self.create_exported(client)
+        
+        response = client.get("/api/decisions/export/json?pretty=true")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        
+        data = response.json()
+        assert len(data["decisions"]) == data["total_decisions"]
+        assert decision_ids <= {d["decision_id"] for d in data["decisions"]}
+        
+        ndjson_lines = client.get("/api/decisions/export/json").text.splitlines()[1:]
+        ndjson_decisions = [json.loads(line) for line in ndjson_lines]
+        assert (
+            {d["decision_id"]: d for d in data["decisions"]} ==
+            {d["decision_id"]: d for d in ndjson_decisions}
+        )
 
-
-def test_health_endpoint():
+def test_health_endpoint(client):
     """Test health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
@@ -205,7 +499,7 @@ def test_health_endpoint():
     assert data["status"] == "healthy"
 
 
-def test_root_endpoint():
+def test_root_endpoint(client):
     """Test root endpoint"""
     response = client.get("/")
     assert response.status_code == 200
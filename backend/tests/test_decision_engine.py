@@ -0,0 +1,16 @@
+"""
+Tests for the example decision engine
+"""
+from app.services.decision_engine import DecisionEngine
+
+
+def test_refund_reasoning_keeps_amount_type():
+    """Test equal amounts of different types are not served each other's cached reasoning"""
+    engine = DecisionEngine()
+    state = {"user_tier": "premium", "refund_count": 0}
+    as_int = engine.make_decision({"request_type": "refund", "amount": 50}, state)
+    as_float = engine.make_decision({"request_type": "refund", "amount": 50.0}, state)
+    
+    assert as_int.decision == as_float.decision == "approve_refund"
+    assert "$50 " in as_int.reasoning
+    assert "$50.0 " in as_float.reasoning
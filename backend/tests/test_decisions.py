@@ -2,24 +2,18 @@
 Unit tests for decision API endpoints
 """
 import pytest
-from fastapi.testclient import TestClient
-from app.main import app
-from app.database import Base, engine
 
-client = TestClient(app)
+pytestmark = pytest.mark.usefixtures("db")
 
-# Create test database
-Base.metadata.create_all(bind=engine)
 
-
-def test_health_check():
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
 
-def test_create_decision():
+def test_create_decision(client):
     """Test creating a new decision"""
     decision_data = {
         "input_data": {"user_id": "test_user", "request": "test_request"},
@@ -40,7 +34,7 @@ def test_create_decision():
     assert data["confidence"] == 0.95
 
 
-def test_get_decisions():
+def test_get_decisions(client):
     """Test retrieving decisions list"""
     response = client.get("/api/decisions")
     assert response.status_code == 200
@@ -49,7 +43,7 @@ def test_get_decisions():
     assert isinstance(data, list)
 
 
-def test_get_decision_by_id():
+def test_get_decision_by_id(client):
     """Test retrieving a specific decision"""
     # First create a decision
     decision_data = {
@@ -72,7 +66,7 @@ def test_get_decision_by_id():
     assert data["decision"] == "test_decision"
 
 
-def test_get_decision_replay():
+def test_get_decision_replay(client):
     """Test replay endpoint"""
     # Create a decision
     decision_data = {
@@ -96,7 +90,7 @@ def test_get_decision_replay():
     assert data["total_steps"] > 0
 
 
-def test_get_stats():
+def test_get_stats(client):
     """Test statistics endpoint"""
     response = client.get("/api/traces/stats")
     assert response.status_code == 200
@@ -107,19 +101,19 @@ def test_get_stats():
     assert "decisions_by_source" in data
 
 
-def test_filter_by_source():
+def test_filter_by_source(client):
     """Test filtering decisions by source"""
     response = client.get("/api/decisions?source=rule")
     assert response.status_code == 200
 
 
-def test_filter_by_confidence():
+def test_filter_by_confidence(client):
     """Test filtering decisions by confidence"""
     response = client.get("/api/decisions?min_confidence=0.8")
     assert response.status_code == 200
 
 
-def test_invalid_decision():
+def test_invalid_decision(client):
     """Test creating decision with invalid data"""
     invalid_data = {
         "input_data": {},
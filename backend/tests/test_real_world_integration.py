@@ -0,0 +1,41 @@
+"""
+Tests for the rule matching in the real-world integration example
+"""
+import pytest
+from examples.real_world_integration import AIDecisionSystem
+
+
+@pytest.fixture
+def ai_system():
+    system = AIDecisionSystem()
+    yield system
+    system.close()
+
+
+@pytest.mark.parametrize("message", [
+    "I need to talk to your legal team",
+    "Our attorneys are preparing lawsuits",
+    "We sued the last company that did this",
+    "This looks like FRAUD to me",
+])
+def test_legal_keywords_escalate(ai_system, message):
+    """Test legal keywords escalate, including plural and inflected forms"""
+    decision = ai_system._decide("support_ticket", {"tier": "standard"}, {"message": message})
+    assert decision.decision == "escalate_to_legal"
+
+
+def test_message_without_legal_keywords_is_not_escalated(ai_system):
+    """Test ordinary tickets fall through to the LLM decision"""
+    decision = ai_system._decide("support_ticket", {"tier": "standard"}, {"message": "My order is late"})
+    assert decision.decision == "escalate_to_human"
+
+
+def test_refund_reasoning_keeps_amount_type(ai_system):
+    """Test equal amounts of different types are not served each other's cached reasoning"""
+    user = {"tier": "premium", "refund_count": 0}
+    as_int = ai_system._decide("refund", user, {"amount": 50})
+    as_float = ai_system._decide("refund", user, {"amount": 50.0})
+    
+    assert as_int.decision == as_float.decision == "approve_refund"
+    assert "$50 " in as_int.reasoning
+    assert "$50.0 " in as_float.reasoning
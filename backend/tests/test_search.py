@@ -0,0 +1,111 @@
+"""
+Tests for decision search
+
+Covers the FTS5 trigram index, the ILIKE fallback for short terms, and
+literal matching of quotes and LIKE wildcards on both paths.
+"""
+import pytest
+
+from app.models import Decision as DecisionModel
+from app.search import MIN_INDEXED_TERM_LENGTH, search_filter
+
+pytestmark = pytest.mark.usefixtures("db")
+
+
+def create_decisions(client, *fields):
+    """Create one decision per dict of overrides, returning their decision_ids"""
+    response = client.post("/api/decisions/batch", json=[
+        {
+            "input_data": {},
+            "reasoning": "Routine check",
+            "decision": "approve",
+            "confidence": 0.8,
+            "source": "rule",
+            **overrides
+        }
+        for overrides in fields
+    ])
+    assert response.status_code == 201
+    return [d["decision_id"] for d in response.json()]
+
+
+def search_ids(client, term):
+    """decision_ids matched by the timeline search"""
+    response = client.get("/api/decisions", params={"search": term, "limit": 100})
+    assert response.status_code == 200
+    return {d["decision_id"] for d in response.json()["decisions"]}
+
+
+def trace_search_ids(client, term):
+    """decision_ids matched by /traces/search"""
+    response = client.get("/api/traces/search", params={"query": term})
+    assert response.status_code == 200
+    return {r["decision_id"] for r in response.json()["results"]}
+
+
+def test_short_terms_fall_back_to_ilike(client, db):
+    """Test terms shorter than a trigram still match, case-insensitively"""
+    qr_id, _ = create_decisions(
+        client,
+        {"reasoning": "Paid by QR code"},
+        {"reasoning": "Paid by card"},
+    )
+    
+    assert len("qr") < MIN_INDEXED_TERM_LENGTH
+    assert "LIKE" in str(search_filter(db, "qr")).upper()
+    assert "decisions_fts" in str(search_filter(db, "qr code"))
+    
+    assert search_ids(client, "qr") == {qr_id}
+    assert search_ids(client, "QR c") == {qr_id}
+
+
+def test_trace_search_is_limited_to_reasoning_and_decision(client):
+    """Test /traces/search ignores the outcome column, unlike the timeline search"""
+    reasoning_id, decision_id, outcome_id = create_decisions(
+        client,
+        {"reasoning": "Flagged as zq duplicate"},
+        {"decision": "zq duplicate"},
+        {"outcome": "zq duplicate confirmed"},
+    )
+    
+    for term in ("zq", "zq dup"):  # ILIKE and FTS paths
+        assert search_ids(client, term) == {reasoning_id, decision_id, outcome_id}
+        assert trace_search_ids(client, term) == {reasoning_id, decision_id}
+
+
+def test_quotes_and_wildcards_match_literally(client):
+    """Test quotes, % and _ are matched as text on both search paths"""
+    quoted_id, percent_id, underscore_id, _, _ = create_decisions(
+        client,
+        {"reasoning": 'Customer said "refund now"'},
+        {"reasoning": "Rule is 100% sure"},
+        {"reasoning": "Matched rule a_b"},
+        {"reasoning": "Rule is 100 percent sure"},
+        {"reasoning": "Matched rule axb"},
+    )
+    
+    assert search_ids(client, '"refund') == {quoted_id}
+    assert search_ids(client, '"') == {quoted_id}
+    assert search_ids(client, "100%") == {percent_id}
+    assert search_ids(client, "%") == {percent_id}
+    assert search_ids(client, "a_b") == {underscore_id}
+    assert search_ids(client, "_b") == {underscore_id}
+
+
+def test_index_follows_updates_and_deletes(client, db):
+    """Test the FTS triggers keep the index in sync with the decisions table"""
+    decision_id, = create_decisions(client, {"reasoning": "Original wording"})
+    assert search_ids(client, "original") == {decision_id}
+    
+    decision = db.query(DecisionModel).filter(DecisionModel.decision_id == decision_id).one()
+    decision.reasoning = "Revised wording"
+    db.commit()
+    
+    assert search_ids(client, "original") == set()
+    assert search_ids(client, "revised") == {decision_id}
+    
+    response = client.delete(f"/api/decisions/{decision_id}")
+    assert response.status_code == 204
+    
+    assert search_ids(client, "revised") == set()
+    assert search_ids(client, "wording") == set()
@@ -2,7 +2,7 @@
 Tests for the trace builder service
 """
 import pytest
-from app.services.trace_builder import TraceBuilder
+from app.services.trace_builder import CachedTraceBuilder, TraceBuilder
 from app.schemas import DecisionCreate, DecisionSource, StepType
 
 
@@ -54,9 +54,35 @@ def test_summarize_input():
     
     # Simple input
     summary = builder._summarize_input({"key": "value"})
-    assert "key" in summary
+    assert summary == "key = value"
     
     # Complex input
     complex_input = {f"key{i}": f"value{i}" for i in range(5)}
     summary = builder._summarize_input(complex_input)
-    assert "more" in summary.lower()  # Should indicate truncation
+    assert summary == "key0=value0, key1=value1, key2=value2, +2 more"  # Should indicate truncation
+    
+    # Exactly three items are not truncated
+    summary = builder._summarize_input({"a": 1, "b": 2, "c": 3})
+    assert summary == "a=1, b=2, c=3"
+
+
+def test_cached_builder_matches_plain_builder():
+    """Test the cached builder returns the same steps, as a fresh list per call"""
+    builder = CachedTraceBuilder(maxsize=8)
+    
+    decision = DecisionCreate(
+        input_data={"user_id": "123", "amount": 50.0},
+        system_state={"user_tier": "premium"},
+        reasoning="User meets criteria",
+        decision="approve",
+        confidence=0.9,
+        source=DecisionSource.RULE,
+        outcome="Refund issued"
+    )
+    
+    first = builder.build_steps(decision)
+    second = builder.build_steps(decision.model_copy(deep=True))
+    
+    assert first == second == TraceBuilder().build_steps(decision)
+    assert first is not second
+    assert len(builder._steps_cache) == 1
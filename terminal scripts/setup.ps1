@@ -41,6 +41,9 @@ Write-Host "Activating virtual environment..." -ForegroundColor Yellow
 Write-Host "Installing Python dependencies..." -ForegroundColor Yellow
 pip install -r requirements.txt
 
+Write-Host "Applying database migrations..." -ForegroundColor Yellow
+alembic upgrade head
+
 Write-Host "Loading demo data..." -ForegroundColor Yellow
 python scripts/load_demo_data.py
 
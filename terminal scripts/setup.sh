@@ -45,6 +45,9 @@ source venv/bin/activate
 echo "Installing Python dependencies..."
 pip install -r requirements.txt
 
+echo "Applying database migrations..."
+alembic upgrade head
+
 echo "Loading demo data..."
 python scripts/load_demo_data.py
 